@@ -5,6 +5,8 @@ from sqlite3.dbapi2 import Connection
 from types import TracebackType
 from typing import Any, Optional, Type
 
+import numpy as np
+
 from project_otto.time import Timestamp
 from project_otto.uart import Message
 
@@ -13,6 +15,17 @@ from .._message_store import MessageStore
 MESSAGES_TABLE_NAME = "received_host_message_log"
 
 
+def _json_default(value: Any) -> Any:
+    """
+    Encodes message field values that the json module does not support natively.
+
+    Numpy arrays (e.g. the turret records of an OdometryMessage) are stored as nested lists.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 class PersistentMessageStore(MessageStore):
     """
     A MessageStore object that inserts messages into a persistent SQL file on disk.
@@ -47,7 +60,7 @@ class PersistentMessageStore(MessageStore):
             message: The Message to be stored.
             receipt_time: the time at which this message was received.
         """
-        message_data = json.dumps(asdict(message))
+        message_data = json.dumps(asdict(message), default=_json_default)
         data = [receipt_time.time_microsecs, message.get_type_id(), message_data]
 
         sub_sql = f"""INSERT INTO {MESSAGES_TABLE_NAME}(
@@ -48,14 +48,15 @@ class OdometryMessageHandler(RxHandler[OdometryMessage, JetsonTimestamp]):
 
         turret = msg.turrets[0]
         turret_pitch = Orientation[TurretYawReferencePointFrame].from_euler_angles(
-            0, math.radians(turret[1]), 0
+            0, math.radians(turret["pitch"]), 0
         )
         turret_yaw = Orientation[TurretBaseReferencePointFrame].from_euler_angles(
             0,
             0,
-            math.radians(turret[2]),
+            math.radians(turret["yaw"]),
         )
-        turret_timestamp = OdometryTimestamp(turret[0])
+        # Convert out of numpy's uint32 so timestamp arithmetic can't wrap around
+        turret_timestamp = OdometryTimestamp(int(turret["time"]))
         turret_odometry_state = OdometryState(
             chassis_position, turret_pitch, turret_yaw, turret_timestamp
         )
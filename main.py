@@ -10,7 +10,7 @@ import time
 from threading import Thread
 from time import perf_counter
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Sequence, Set, Type
+from typing import Any, Callable, List, Optional, Sequence, Type
 
 import torch
 
@@ -90,15 +90,13 @@ class CommandlineOptions:
         self.verbosity = logging.getLevelName(argparse_namespace.verbose)
 
 
-def _positions_to_robot_targets(
+def _build_robot_target_factory(
     detection_confidence: float,
     team_color: TeamColor,
     uncertainty: LinearUncertainty[WorldFrame],
-    positions: Sequence[Position[WorldFrame]],
-) -> Set[DetectedTargetPosition[WorldFrame]]:
-    return set(
-        DetectedTargetPosition(detection_confidence, team_color, MeasuredPosition(x, uncertainty))
-        for x in positions
+) -> Callable[[Position[WorldFrame]], DetectedTargetPosition[WorldFrame]]:
+    return lambda position: DetectedTargetPosition(
+        detection_confidence, team_color, MeasuredPosition(position, uncertainty)
     )
 
 
@@ -118,6 +116,11 @@ class MainApplication:
         self._robot_identity_manager = RobotIdentityManager()
         self._selected_target: Optional[OpenCVKalmanTrackedTarget] = None
 
+        # The odometry buffer returns the same stored OdometryState when the camera outpaces
+        # odometry, so the transforms built from it can be reused across frames.
+        self._last_odometry: Optional[OdometryState] = None
+        self._last_transform_provider: Optional[ApplicationTransformProvider] = None
+
         self._update_rate_monitor = UpdateRateMonitor()
         self._is_initialized = False
 
@@ -241,6 +244,22 @@ class MainApplication:
             max_radius=self._config.target_selector.max_radius,
         )
 
+        # Configuration is fixed at runtime; cache the values read on every frame
+        self._fps_log_interval = self._config.core.fps_log_interval
+        self._fps_log_low_fps_threshold = self._config.core.fps_log_low_fps_threshold
+        self._plate_filtering_config = self._config.plate_filtering
+        self._plate_projection_uncertainty_config = self._config.plate_projection_uncertainty
+
+        # Robots don't have confidence or color, but we need a WorldDetectedTargetSet.
+        # TODO: Fix the data structures so that we don't need to build a dummy target set.
+        self._make_robot_target = _build_robot_target_factory(
+            detection_confidence=1.0,
+            team_color=TeamColor.BLUE,
+            uncertainty=LinearUncertainty[WorldFrame].from_variances(
+                *[self._config.robot_uncertainty.robot_position_variance] * 3
+            ),
+        )
+
         end_time = time.perf_counter()
         logging.info(f"Initialization complete after {end_time-start_time:.2f}s")
 
@@ -335,6 +354,12 @@ class MainApplication:
             yaw_reference_frame_to_pitch_reference_frame_transform=yaw_to_pitch_transform,
         )
 
+    def _get_transform_provider(self, odometry: OdometryState) -> ApplicationTransformProvider:
+        if odometry is not self._last_odometry or self._last_transform_provider is None:
+            self._last_transform_provider = self._build_transform_provider(odometry)
+            self._last_odometry = odometry
+        return self._last_transform_provider
+
     def _send_auto_aim_update_to_host(self, mcb_timestamp: OdometryTimestamp):
         if self._target_selector.target is None:
             self._mcb_comms.send(AutoAimTargetUpdateMessage.without_target(mcb_timestamp))
@@ -349,7 +374,7 @@ class MainApplication:
 
     def _update_fps_logging(self):
         time_since_fps_log = self._update_rate_monitor.duration_since_reset
-        if time_since_fps_log > self._config.core.fps_log_interval:
+        if time_since_fps_log > self._fps_log_interval:
             average_update_period = self._update_rate_monitor.average_update_period
             if average_update_period is None:
                 average_fps = 0
@@ -358,11 +383,12 @@ class MainApplication:
             self._update_rate_monitor.reset()
 
             logging.info(
-                f"Average FPS over last {time_since_fps_log.duration_seconds:.2f} seconds: "
-                + f"{average_fps:.2f}"
+                "Average FPS over last %.2f seconds: %.2f",
+                time_since_fps_log.duration_seconds,
+                average_fps,
             )
-            if average_fps < self._config.core.fps_log_low_fps_threshold:
-                logging.warn(f"Average FPS below {self._config.core.fps_log_low_fps_threshold}")
+            if average_fps < self._fps_log_low_fps_threshold:
+                logging.warning("Average FPS below %s", self._fps_log_low_fps_threshold)
 
     def run_forever(self):
         """
@@ -372,6 +398,12 @@ class MainApplication:
 
         self._update_rate_monitor.reset()
 
+        # Hoisted out of the loop; these are fixed after initialization.
+        plate_tracker = self._plate_tracker
+        robot_tracker = self._robot_tracker
+        target_selector = self._target_selector
+        make_robot_target = self._make_robot_target
+
         while True:
             # Check UART status
             if not self._uart_thread.is_alive():
@@ -394,70 +426,72 @@ class MainApplication:
                 continue
 
             # Remove plates which are too small or wrong color
-            filtered_plates = prune_invalid_targets(
-                identity.color, detected_plates, self._config.plate_filtering
+            filtered_plates, rejected_plates = prune_invalid_targets(
+                identity.color, detected_plates, self._plate_filtering_config
             )
 
             # Get corresponding odometry
-            odometry = self._odom_buffer.search(frameset.time)
+            frame_time = frameset.time
+            odometry = self._odom_buffer.search(frame_time)
             if odometry is None:
                 oldest_in_buffer = self._odom_buffer.oldest_timestamp
                 latest_in_buffer = self._odom_buffer.latest_timestamp
                 logging.warning(
-                    f"Frame timestamped at time {frameset.time} not within odometry buffer range."
-                    + f" Buffer range is currently: [{oldest_in_buffer}, {latest_in_buffer}]"
+                    "Frame timestamped at time %s not within odometry buffer range."
+                    + " Buffer range is currently: [%s, %s]",
+                    frame_time,
+                    oldest_in_buffer,
+                    latest_in_buffer,
                 )
                 continue
 
+            odometry_timestamp = odometry.timestamp
+
             # Build transforms for current sensor data
-            transform_provider = self._build_transform_provider(odometry)
+            transform_provider = self._get_transform_provider(odometry)
 
             # Transform detections into 3D world-relative points
             camera_relative_detected_targets = (
                 CameraRelativeDetectedTargetSet.from_detected_rectangles(
-                    frameset, filtered_plates, self._config.plate_projection_uncertainty
+                    frameset, filtered_plates, self._plate_projection_uncertainty_config
                 )
             )
             world_relative_detected_targets = WorldDetectedTargetSet.from_camera_relative(
                 camera_relative_detected_targets,
                 transform_provider,
-                odometry.timestamp,
+                odometry_timestamp,
             )
+            jetson_timestamp = camera_relative_detected_targets.timestamp
 
             # Correlate and update trackers
-            self._plate_tracker.update(world_relative_detected_targets)
+            plate_tracker.update(world_relative_detected_targets)
 
             self._robot_clusterer.update(
-                targets=self._plate_tracker.all_tracked_targets,
-                current_time=camera_relative_detected_targets.timestamp,
+                targets=plate_tracker.all_tracked_targets,
+                current_time=jetson_timestamp,
             )
 
-            # Robots don't have confidence or color, but we need a WorldDetectedTargetSet.
-            # TODO: Fix the data structures so that we don't need to build a dummy target set.
-            clustered_detected_target_positions = _positions_to_robot_targets(
-                detection_confidence=1.0,
-                team_color=TeamColor.BLUE,
-                uncertainty=LinearUncertainty[WorldFrame].from_variances(
-                    *[self._config.robot_uncertainty.robot_position_variance] * 3
-                ),
-                positions=self._robot_clusterer.centers,
+            clustered_detected_target_positions = tuple(
+                make_robot_target(center) for center in self._robot_clusterer.centers
             )
 
-            self._robot_tracker.update(
+            robot_tracker.update(
                 WorldDetectedTargetSet(
                     positions=clustered_detected_target_positions,
-                    jetson_timestamp=camera_relative_detected_targets.timestamp,
-                    odometry_timestamp=odometry.timestamp,
+                    jetson_timestamp=jetson_timestamp,
+                    odometry_timestamp=odometry_timestamp,
                 )
             )
+            robot_targets = robot_tracker.all_tracked_targets
+            plate_targets = plate_tracker.all_tracked_targets
 
             # Update selected target
-            self._target_selector.update(
+            target_selector.update(
                 TargetSelectorUpdateState(
                     robot_selector=self._build_robot_selector(transform_provider),
                     plate_selector=self._build_plate_selector(transform_provider),
-                    robots=self._robot_tracker.all_tracked_targets,
-                    plates=self._plate_tracker.all_tracked_targets,
+                    robots=robot_targets,
+                    plates=plate_targets,
                 )
             )
 
@@ -465,16 +499,16 @@ class MainApplication:
             target_select_message = self._target_selection_request_manager.consume_queued_request()
             if target_select_message is not None:
                 logging.info(
-                    f"Received target reselection message {target_select_message.request_id}"
+                    "Received target reselection message %s", target_select_message.request_id
                 )
 
-                original_target = self._target_selector.robot_target
-                self._target_selector.reselect()
-                new_target = self._target_selector.robot_target
+                original_target = target_selector.robot_target
+                target_selector.reselect()
+                new_target = target_selector.robot_target
                 original_id = original_target.instance_id if original_target else None
                 new_id = new_target.instance_id if new_target else None
 
-                logging.info(f"Performed target reselection: {original_id} -> {new_id}")
+                logging.info("Performed target reselection: %s -> %s", original_id, new_id)
 
             if self._streaming_handler.has_client:
                 graphics = DebugRenderer(
@@ -483,43 +517,33 @@ class MainApplication:
 
                 # Plate detections
                 graphics.render_detected_plates(filtered_plates.plates)
-                graphics.render_rejected_detected_plates(
-                    detected_plates.plates.difference(filtered_plates.plates)
-                )
+                graphics.render_rejected_detected_plates(rejected_plates.plates)
 
                 # Robot tracking
-                graphics.render_estimated_target_positions(
-                    self._robot_tracker.all_tracked_targets, is_robot=True
-                )
+                graphics.render_estimated_target_positions(robot_targets, is_robot=True)
                 graphics.render_identities(
-                    self._robot_tracker.all_tracked_targets,
+                    robot_targets,
                     selected_instance_id=(
-                        self._target_selector.robot_target.instance_id
-                        if self._target_selector.robot_target
+                        target_selector.robot_target.instance_id
+                        if target_selector.robot_target
                         else None
                     ),
-                    is_active_aim_target=(
-                        self._target_selector.target is self._target_selector.robot_target
-                    ),
+                    is_active_aim_target=(target_selector.target is target_selector.robot_target),
                     is_robot=True,
                 )
 
                 # Plate tracking
-                graphics.render_estimated_target_positions(
-                    self._plate_tracker.all_tracked_targets, is_robot=False
-                )
-                graphics.render_estimated_plate_velocities(self._plate_tracker.all_tracked_targets)
-                graphics.render_estimate_uncertainties(self._plate_tracker.all_tracked_targets)
+                graphics.render_estimated_target_positions(plate_targets, is_robot=False)
+                graphics.render_estimated_plate_velocities(plate_targets)
+                graphics.render_estimate_uncertainties(plate_targets)
                 graphics.render_identities(
-                    self._plate_tracker.all_tracked_targets,
+                    plate_targets,
                     selected_instance_id=(
-                        self._target_selector.plate_target.instance_id
-                        if self._target_selector.plate_target
+                        target_selector.plate_target.instance_id
+                        if target_selector.plate_target
                         else None
                     ),
-                    is_active_aim_target=(
-                        self._target_selector.target is self._target_selector.plate_target
-                    ),
+                    is_active_aim_target=(target_selector.target is target_selector.plate_target),
                     is_robot=False,
                 )
 
@@ -528,7 +552,7 @@ class MainApplication:
                 self._streaming_handler.on_receive_frame(graphics.debug_frame)
 
             # Send updated target data to MCB
-            self._send_auto_aim_update_to_host(odometry.timestamp)
+            self._send_auto_aim_update_to_host(odometry_timestamp)
 
             # Update FPS counters and logging
             self._update_rate_monitor.register_update_complete()
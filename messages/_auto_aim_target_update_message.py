@@ -1,13 +1,21 @@
 import struct
 from dataclasses import dataclass
+from typing import Tuple
 
 from project_otto.frames import WorldFrame
 from project_otto.spatial import Position, Vector
 from project_otto.timestamps import OdometryTimestamp
 from project_otto.uart import SerializableMessage
 
+_PACKET_FORMAT = struct.Struct("<9f?I")
 
-@dataclass
+# Field values of an AutoAimTargetUpdateMessage, in declaration order
+_MessageState = Tuple[
+    Position[WorldFrame], Vector[WorldFrame], Vector[WorldFrame], bool, OdometryTimestamp
+]
+
+
+@dataclass(frozen=True)
 class AutoAimTargetUpdateMessage(SerializableMessage):
     """
     Class for sending auto aim target updates to MCB.
@@ -21,12 +29,34 @@ class AutoAimTargetUpdateMessage(SerializableMessage):
         target data was calculated.
     """
 
+    __slots__ = ("position", "velocity", "acceleration", "has_target", "mcb_timestamp")
+
     position: Position[WorldFrame]
     velocity: Vector[WorldFrame]
     acceleration: Vector[WorldFrame]
     has_target: bool
     mcb_timestamp: OdometryTimestamp
 
+    # Frozen and slotted, so copy and pickle have to restore the fields via object.__setattr__
+    def __getstate__(self) -> _MessageState:
+        """
+        Returns the field values, in declaration order, for copy and pickle.
+        """
+        return (
+            self.position,
+            self.velocity,
+            self.acceleration,
+            self.has_target,
+            self.mcb_timestamp,
+        )
+
+    def __setstate__(self, state: _MessageState):
+        """
+        Restores the field values returned by __getstate__.
+        """
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     @classmethod
     def without_target(cls, mcb_timestamp: OdometryTimestamp) -> "AutoAimTargetUpdateMessage":
         """
@@ -89,8 +119,7 @@ class AutoAimTargetUpdateMessage(SerializableMessage):
             The data format is:
             (9x float (4 bytes each), boolean (1 byte), unsigned int (4 bytes))
         """
-        return struct.pack(
-            "<9f?I",
+        return _PACKET_FORMAT.pack(
             *self.position.as_tuple(),
             *self.velocity.as_tuple(),
             *self.acceleration.as_tuple(),
@@ -1,12 +1,19 @@
 """Odometry Message."""
 import struct
 from dataclasses import dataclass
-from typing import Iterator, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 from project_otto.uart import ReadableMessage
 
+_HEADER_FORMAT = struct.Struct("<L6fB")
+_HEADER_SIZE = _HEADER_FORMAT.size
+_TURRET_DTYPE = np.dtype([("time", "<u4"), ("pitch", "<f4"), ("yaw", "<f4")])
+_TURRET_SIZE = _TURRET_DTYPE.itemsize
+
 
-@dataclass
+@dataclass(eq=False)
 class OdometryMessage(ReadableMessage):
     """
     Message that contains odometry data.
@@ -19,9 +26,12 @@ class OdometryMessage(ReadableMessage):
         pitch: a float that represents the chassis pitch
         yaw: a float that represents the chassis yaw
         roll: a float that represents the chassis roll
-        turrets: a list of tuples containing turret pitch (index 0) and yaw (index 1) in degrees.
+        turrets: a structured array with one record per turret, holding the turret timestamp
+            (``time``) and its ``pitch`` and ``yaw`` in degrees.
     """
 
+    __slots__ = ("time", "x_pos", "y_pos", "z_pos", "pitch", "yaw", "roll", "turrets")
+
     time: int
     x_pos: float
     y_pos: float
@@ -29,7 +39,28 @@ class OdometryMessage(ReadableMessage):
     pitch: float
     yaw: float
     roll: float
-    turrets: List[Tuple[int, float, float]]  # Turret Time, pitch, yaw;
+    turrets: npt.NDArray[np.void]
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares messages field by field, and the turret records element-wise.
+
+        The dataclass-generated comparison can't be used, as comparing arrays within tuples
+        raises rather than giving a bool.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, OdometryMessage)
+        return (
+            self.time == other.time
+            and self.x_pos == other.x_pos
+            and self.y_pos == other.y_pos
+            and self.z_pos == other.z_pos
+            and self.pitch == other.pitch
+            and self.yaw == other.yaw
+            and self.roll == other.roll
+            and bool(np.array_equal(self.turrets, other.turrets))
+        )
 
     @staticmethod
     def get_type_id() -> int:
@@ -58,29 +89,26 @@ class OdometryMessage(ReadableMessage):
         # turret1_time: int
         # turret1_pitch: float
         # turret1_yaw: float
-        packet_format: str = "<L6fB"
-        expected_size: int = struct.calcsize(packet_format)
+        expected_size: int = _HEADER_SIZE
 
-        time, x_pos, y_pos, z_pos, pitch, yaw, roll, num_turrets = struct.unpack(
-            packet_format, data[:expected_size]
-        )
+        time, x_pos, y_pos, z_pos, pitch, yaw, roll, num_turrets = _HEADER_FORMAT.unpack_from(data)
 
-        packet_format_turrets: str = "<L2f"  # Turret timestamp, pitch, yaw.
-        turret_data_size: int = struct.calcsize(packet_format_turrets)
-        received_turret_num: int = len(data[expected_size:]) // turret_data_size
+        turret_data_size: int = _TURRET_SIZE
+        turret_bytes: int = len(data) - expected_size
+        received_turret_num: int = turret_bytes // turret_data_size
 
-        if (len(data[expected_size:]) // turret_data_size) != num_turrets:
+        if received_turret_num != num_turrets:
             raise ValueError(f"expected {num_turrets} turrets, received {received_turret_num}")
-        if len(data) != (expected_size + turret_data_size * num_turrets):
+        if turret_bytes % turret_data_size != 0:
             raise ValueError(
                 f"length of data must be {expected_size + turret_data_size * num_turrets}, "
                 + f"received {len(data)}"
             )
 
-        turrets_tuple_iterator: Iterator[Tuple[int, float, float]] = struct.iter_unpack(
-            packet_format_turrets, data[expected_size:]
-        )
-
-        turrets_list: List[Tuple[int, float, float]] = list(turrets_tuple_iterator)
+        # Decoded in one call, with no per-turret Python objects. Copied out of the view over the
+        # received bytes, so that the message doesn't keep the whole packet alive.
+        turrets = np.frombuffer(
+            data, dtype=_TURRET_DTYPE, count=num_turrets, offset=expected_size
+        ).copy()
 
-        return OdometryMessage(time, x_pos, y_pos, z_pos, pitch, yaw, roll, turrets_list)
+        return OdometryMessage(time, x_pos, y_pos, z_pos, pitch, yaw, roll, turrets)
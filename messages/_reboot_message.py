@@ -10,6 +10,8 @@ class RebootMessage(ReadableMessage):
     Message that tells the robot to reboot.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def get_type_id():
         """
@@ -22,6 +24,10 @@ class RebootMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
 
-        Note that there is no byte message for this message.
+        Note that there is no byte message for this message, so a shared instance is returned.
         """
-        return RebootMessage()
+        return _REBOOT_MESSAGE
+
+
+# The message carries no data, so every parse can return the same instance.
+_REBOOT_MESSAGE = RebootMessage()
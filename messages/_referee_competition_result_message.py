@@ -1,9 +1,10 @@
 """Referee Competition Result Message."""
-import struct
 from dataclasses import dataclass
 
 from project_otto.uart import ReadableMessage
 
+_PACKET_SIZE = 1  # competition_result: unsigned byte
+
 
 @dataclass
 class RefereeCompetitionResultMessage(ReadableMessage):
@@ -16,6 +17,8 @@ class RefereeCompetitionResultMessage(ReadableMessage):
         competition_result: int representing the competition result.
     """
 
+    __slots__ = ("competition_result",)
+
     competition_result: int
 
     @staticmethod
@@ -30,14 +33,11 @@ class RefereeCompetitionResultMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
         """
-        packet_format: str = "<B"
-        expected_size: int = struct.calcsize(packet_format)
+        expected_size: int = _PACKET_SIZE
 
         if len(data) != expected_size:
-            raise ValueError(
-                f"length of data must be {str(expected_size)}, received {str(len(data))}"
-            )
+            raise ValueError(f"length of data must be {expected_size}, received {len(data)}")
 
-        (competition_result,) = struct.unpack(packet_format, data)
+        competition_result = data[0]
 
         return RefereeCompetitionResultMessage(competition_result)
@@ -1,12 +1,12 @@
 """Referee Realtime Data Message."""
 import struct
 from dataclasses import dataclass
-from typing import Tuple
-
-import bitstruct  # type: ignore
 
 from project_otto.uart import ReadableMessage
 
+_PACKET_FORMAT = struct.Struct("<BHQB")
+_PACKET_SIZE = _PACKET_FORMAT.size
+
 
 @dataclass
 class RefereeRealtimeDataMessage(ReadableMessage):
@@ -23,6 +23,16 @@ class RefereeRealtimeDataMessage(ReadableMessage):
         power_shooter: bool representing whether there is 24V output from the shooter port.
     """
 
+    __slots__ = (
+        "competition_type",
+        "competition_stage",
+        "remaining_round_time",
+        "update_unix_time",
+        "power_gimbal",
+        "power_chassis",
+        "power_shooter",
+    )
+
     competition_type: int
     competition_stage: int
     remaining_round_time: int
@@ -43,30 +53,26 @@ class RefereeRealtimeDataMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
         """
-        packet_format: str = "<cHQc"
-        expected_size: int = struct.calcsize(packet_format)
+        expected_size: int = _PACKET_SIZE
 
         if len(data) != expected_size:
-            raise ValueError(
-                f"length of data must be {str(expected_size)}, received {str(len(data))}"
-            )
+            raise ValueError(f"length of data must be {expected_size}, received {len(data)}")
 
-        competition_byte, remaining_round_time, update_unix_time, power_byte = struct.unpack(
-            packet_format, data
-        )
-
-        competition_byte_tuple: Tuple[int, int] = bitstruct.unpack(">u4u4", competition_byte)
-        power_byte_tuple: Tuple[bool, bool, bool] = bitstruct.unpack(">p5b1b1b1", power_byte)
+        (
+            competition_byte,
+            remaining_round_time,
+            update_unix_time,
+            power_byte,
+        ) = _PACKET_FORMAT.unpack(data)
 
-        # order is reversed because bitstruct puts the value
-        # from the first bit (on the right) into the last index on the tuple
-        # (ex. 0b00000011 = (False, True, True))
+        # Competition byte: stage in the high nibble, type in the low nibble.
+        # Power byte: gimbal, chassis and shooter flags in bits 0, 1 and 2 respectively.
         return RefereeRealtimeDataMessage(
-            competition_byte_tuple[1],
-            competition_byte_tuple[0],
+            competition_byte & 0x0F,
+            competition_byte >> 4,
             remaining_round_time,
             update_unix_time,
-            power_byte_tuple[2],
-            power_byte_tuple[1],
-            power_byte_tuple[0],
+            bool(power_byte & 0x01),
+            bool(power_byte & 0x02),
+            bool(power_byte & 0x04),
         )
@@ -1,9 +1,10 @@
 """Referee Robot ID Message."""
-import struct
 from dataclasses import dataclass
 
 from project_otto.uart import ReadableMessage
 
+_PACKET_SIZE = 1  # robot_id: unsigned byte
+
 
 @dataclass
 class RefereeRobotIDMessage(ReadableMessage):
@@ -17,6 +18,8 @@ class RefereeRobotIDMessage(ReadableMessage):
         robot_id: int representing the robot ID.
     """
 
+    __slots__ = ("robot_id",)
+
     robot_id: int
 
     @staticmethod
@@ -31,14 +34,11 @@ class RefereeRobotIDMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
         """
-        packet_format: str = "<B"
-        expected_size: int = struct.calcsize(packet_format)
+        expected_size: int = _PACKET_SIZE
 
         if len(data) != expected_size:
-            raise ValueError(
-                f"length of data must be {str(expected_size)}, received {str(len(data))}"
-            )
+            raise ValueError(f"length of data must be {expected_size}, received {len(data)}")
 
-        (robot_id,) = struct.unpack(packet_format, data)
+        robot_id = data[0]
 
         return RefereeRobotIDMessage(robot_id)
@@ -1,9 +1,10 @@
 """Referee Warning Message."""
-import struct
 from dataclasses import dataclass
 
 from project_otto.uart import ReadableMessage
 
+_PACKET_SIZE = 2  # warning_level, foul_robot_id: one unsigned byte each
+
 
 @dataclass
 class RefereeWarningMessage(ReadableMessage):
@@ -17,6 +18,8 @@ class RefereeWarningMessage(ReadableMessage):
         foul_robot_id: int representing the foul robot ID.
     """
 
+    __slots__ = ("warning_level", "foul_robot_id")
+
     warning_level: int
     foul_robot_id: int
 
@@ -32,14 +35,11 @@ class RefereeWarningMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
         """
-        packet_format: str = "<2B"
-        expected_size: int = struct.calcsize(packet_format)
+        expected_size: int = _PACKET_SIZE
 
         if len(data) != expected_size:
-            raise ValueError(
-                f"length of data must be {str(expected_size)}, received {str(len(data))}"
-            )
+            raise ValueError(f"length of data must be {expected_size}, received {len(data)}")
 
-        (warning_level, foul_robot_id) = struct.unpack(packet_format, data)
+        warning_level, foul_robot_id = data[0], data[1]
 
         return RefereeWarningMessage(warning_level, foul_robot_id)
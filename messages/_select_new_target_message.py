@@ -4,6 +4,9 @@ from dataclasses import dataclass
 
 from project_otto.uart import ReadableMessage
 
+_PACKET_FORMAT = struct.Struct("<I")
+_PACKET_SIZE = _PACKET_FORMAT.size
+
 
 @dataclass
 class SelectNewTargetMessage(ReadableMessage):
@@ -14,6 +17,8 @@ class SelectNewTargetMessage(ReadableMessage):
         request_id: an :int: that represents the seqeuence number of the target
     """
 
+    __slots__ = ("request_id",)
+
     @staticmethod
     def get_type_id():
         """
@@ -28,12 +33,11 @@ class SelectNewTargetMessage(ReadableMessage):
         """
         Method that parses a byte message and returns the results in a message dataclass.
         """
-        packet_format = "<I"
-        expected_size = struct.calcsize(packet_format)
+        expected_size = _PACKET_SIZE
 
         if len(data) != expected_size:
             raise ValueError(f"length of data must be {expected_size}")
 
-        request_id = struct.unpack(packet_format, data)[0]
+        request_id = _PACKET_FORMAT.unpack(data)[0]
 
         return SelectNewTargetMessage(request_id)
@@ -20,6 +20,8 @@ class OdometryState:
     Also contains the associated MCB :class:`~project_otto.time.Timestamp`.
     """
 
+    __slots__ = ("position", "pitch", "yaw", "timestamp")
+
     position: Position[WorldFrame]
     pitch: Orientation[TurretYawReferencePointFrame]
     yaw: Orientation[TurretBaseReferencePointFrame]
@@ -10,5 +10,7 @@ class RobotIdentity:
     A robot identity, combining a team color and robot typpe.
     """
 
+    __slots__ = ("color", "type")
+
     color: TeamColor
     type: RobotType
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 from project_otto.frames import WorldFrame
 from project_otto.spatial import Position
@@ -11,5 +12,21 @@ class TimestampedPosition:
     Represents a timestamp, position pair.
     """
 
+    __slots__ = ("timestamp", "position")
+
     timestamp: JetsonTimestamp
     position: Position[WorldFrame]
+
+    def __getstate__(self) -> Tuple[JetsonTimestamp, Position[WorldFrame]]:
+        """
+        Returns the timestamp and position, for copy and pickle.
+        """
+        return (self.timestamp, self.position)
+
+    def __setstate__(self, state: Tuple[JetsonTimestamp, Position[WorldFrame]]):
+        """
+        Restores the timestamp and position returned by __getstate__.
+        """
+        timestamp, position = state
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "position", position)
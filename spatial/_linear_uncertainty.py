@@ -28,13 +28,15 @@ class LinearUncertainty(Generic[InFrame]):
         """
         Constructs a LinearUncertainty described by a diagonal covariance matrix.
         """
-        return LinearUncertainty(
-            np.diag(np.array([x_variance, y_variance, z_variance], dtype=np.float64))
-        )
+        covariance = np.zeros((NUM_SPATIAL_DIMS, NUM_SPATIAL_DIMS), dtype=np.float64)
+        covariance[0, 0] = x_variance
+        covariance[1, 1] = y_variance
+        covariance[2, 2] = z_variance
+        return LinearUncertainty(covariance)
 
     def __post_init__(self):
         """
-        Post-init validation.
+        Post-init validation and normalization.
         """
         height, width = self.covariance.shape
 
@@ -43,10 +45,17 @@ class LinearUncertainty(Generic[InFrame]):
                 f"LinearUncertainty requires 3x3 covariance matrix, got {height}x{width}"
             )
 
+        # Stored as contiguous float64, with -0.0 folded into 0.0 by adding zero, so that equal
+        # matrices have equal bytes for __hash__
+        object.__setattr__(
+            self, "covariance", np.ascontiguousarray(self.covariance, dtype=np.float64) + 0.0
+        )
+
     def __hash__(self):
         """
         Hash function.
 
-        NumPy arrays and Python lists do not support hashing, so we build tuples.
+        NumPy arrays do not support hashing, so we hash the raw bytes of the matrix instead. These
+        are comparable across instances since the matrix is normalized on construction.
         """
-        return hash((self.covariance.shape, tuple(self.covariance.flatten().tolist())))
+        return hash((self.covariance.shape, self.covariance.tobytes()))
@@ -1,6 +1,7 @@
 import warnings
 from dataclasses import dataclass
-from typing import Any, Collection, Generic, Tuple, Type, TypeVar
+from math import atan2, cos, sin, sqrt
+from typing import Any, Collection, Generic, Optional, Tuple, Type, TypeVar
 
 import numpy as np
 import numpy.typing as npt
@@ -15,12 +16,15 @@ from ._frame import Frame
 # "correctly" while taking np arrays as inputs which might have arbitrary type.
 NpArray = npt.NDArray[Any]
 
+# Threshold below which the cosine of pitch is treated as zero (gimbal lock); matches transforms3d.
+_GIMBAL_LOCK_EPSILON = np.finfo(float).eps * 4.0
+
 
 InFrame = TypeVar("InFrame", bound="Frame")
 NewInFrame = TypeVar("NewInFrame", bound="Frame")
 
 
-@dataclass
+@dataclass(frozen=True)
 class Orientation(Generic[InFrame]):
     """
     Represents an orientation as a unit quaternion.
@@ -38,6 +42,10 @@ class Orientation(Generic[InFrame]):
         z: *z* component of the quaternion representation of this Orientation.
     """
 
+    # "_tuple" and "_matrix" are caches rather than dataclass fields, so they take no part in
+    # eq/hash/repr. "_matrix" stays unset until as_matrix() first builds it.
+    __slots__ = ("w", "x", "y", "z", "_tuple", "_matrix")
+
     w: float
     x: float
     y: float
@@ -46,6 +54,24 @@ class Orientation(Generic[InFrame]):
     def __post_init__(self):
         """post-init hook for the @dataclass's generated __init__ function."""
         self._normalize_in_place()
+        object.__setattr__(self, "_tuple", (self.w, self.x, self.y, self.z))
+
+    def __getstate__(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the quaternion components, for copy and pickle.
+        """
+        return self._tuple
+
+    def __setstate__(self, state: Tuple[float, float, float, float]):
+        """
+        Restores the components returned by __getstate__, along with the tuple cache.
+        """
+        w, x, y, z = state
+        object.__setattr__(self, "w", w)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+        object.__setattr__(self, "_tuple", (w, x, y, z))
 
     @staticmethod
     def from_values(
@@ -61,23 +87,40 @@ class Orientation(Generic[InFrame]):
             in_frame: An optional type hint (class type) to constrain the frame of the returned
                 Orientation.
         """
+        if isinstance(values, np.ndarray) and values.shape == (4,):
+            # Convert to Python floats in one call, so later scalar math avoids NumPy scalars
+            w, x, y, z = values.tolist()
+            return Orientation(w, x, y, z)
+
         if len(values) != 4:
             raise ValueError(
                 "expected quaternion as a four-tuple (w, x, y, z), "
                 + f"got object with length {len(values)}"
             )
 
-        values_tuple = tuple(values)
-        return Orientation[InFrame](
-            values_tuple[0], values_tuple[1], values_tuple[2], values_tuple[3]
-        )
+        w, x, y, z = values
+        return Orientation(w, x, y, z)
+
+    @classmethod
+    def _from_unit(cls, w: float, x: float, y: float, z: float) -> "Orientation[InFrame]":
+        """
+        Constructs an Orientation from components the caller guarantees already form a unit
+        quaternion, skipping normalization.
+        """
+        orientation = object.__new__(cls)
+        object.__setattr__(orientation, "w", w)
+        object.__setattr__(orientation, "x", x)
+        object.__setattr__(orientation, "y", y)
+        object.__setattr__(orientation, "z", z)
+        object.__setattr__(orientation, "_tuple", (w, x, y, z))
+        return orientation
 
     @staticmethod
     def of_identity() -> "Orientation[InFrame]":
         """
         Returns an Orientation representing a null/identity/unit rotation -- "straight ahead".
         """
-        return Orientation[InFrame](1, 0, 0, 0)
+        return Orientation._from_unit(1.0, 0.0, 0.0, 0.0)
 
     def as_tuple(self) -> Tuple[float, float, float, float]:
         """
@@ -90,27 +133,43 @@ class Orientation(Generic[InFrame]):
         Returns:
             The represented quaternion as a tuple of the form ``(w, x, y, z)``.
         """
-        return (
-            self.w,
-            self.x,
-            self.y,
-            self.z,
-        )
+        return self._tuple
 
     def as_matrix(self) -> NpArray:
         """
         Returns this Orientation represented as a 3x3 rotation matrix.
+
+        The matrix is computed on first use and cached. The returned array is read-only.
         """
-        mat: NpArray = transforms3d.quaternions.quat2mat(self.as_tuple())
+        mat: Optional[NpArray] = getattr(self, "_matrix", None)
+        if mat is None:
+            w, x, y, z = self.as_tuple()
+            xx, yy, zz = x * x, y * y, z * z
+            xy, xz, yz = x * y, x * z, y * z
+            wx, wy, wz = w * x, w * y, w * z
+
+            # Standard unit-quaternion rotation matrix, as computed by transforms3d's quat2mat
+            mat = np.array(
+                [
+                    [1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy)],
+                    [2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx)],
+                    [2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy)],
+                ]
+            )
+            mat.flags.writeable = False
+            object.__setattr__(self, "_matrix", mat)
+
         return mat
 
     def _normalize_in_place(self):
-        norm: float = transforms3d.quaternions.qnorm(self.as_tuple())
+        w, x, y, z = self.w, self.x, self.y, self.z
+        inverse_norm = 1.0 / sqrt(w * w + x * x + y * y + z * z)
 
-        self.w /= norm
-        self.x /= norm
-        self.y /= norm
-        self.z /= norm
+        # Orientation is frozen; normalization is the one place components are adjusted
+        object.__setattr__(self, "w", w * inverse_norm)
+        object.__setattr__(self, "x", x * inverse_norm)
+        object.__setattr__(self, "y", y * inverse_norm)
+        object.__setattr__(self, "z", z * inverse_norm)
 
     def conjugate(self, in_frame: Type[NewInFrame] = Any) -> "Orientation[NewInFrame]":
         """
@@ -139,8 +198,8 @@ class Orientation(Generic[InFrame]):
         Returns:
             An Orientation representing the opposite transform of "self".
         """
-        arr: NpArray = transforms3d.quaternions.qconjugate(self.as_tuple())
-        return Orientation.from_values(arr)
+        # Negating the vector part preserves the norm, so there is nothing to re-normalize
+        return Orientation._from_unit(self.w, -self.x, -self.y, -self.z)
 
     @staticmethod
     def from_euler_angles(
@@ -162,8 +221,18 @@ class Orientation(Generic[InFrame]):
 
         Returns: An Orientation representing the requested rotation
         """
-        quat: NpArray = transforms3d.euler.euler2quat(yaw, pitch, roll, axes="rzyx")
-        return Orientation[InFrame](quat[0], quat[1], quat[2], quat[3])
+        # Product of the three half-angle axis quaternions, equivalent to transforms3d's
+        # euler2quat(yaw, pitch, roll, axes="rzyx")
+        roll_cos, roll_sin = cos(roll * 0.5), sin(roll * 0.5)
+        pitch_cos, pitch_sin = cos(pitch * 0.5), sin(pitch * 0.5)
+        yaw_cos, yaw_sin = cos(yaw * 0.5), sin(yaw * 0.5)
+
+        return Orientation[InFrame](
+            roll_cos * pitch_cos * yaw_cos + roll_sin * pitch_sin * yaw_sin,
+            roll_sin * pitch_cos * yaw_cos - roll_cos * pitch_sin * yaw_sin,
+            roll_cos * pitch_sin * yaw_cos + roll_sin * pitch_cos * yaw_sin,
+            roll_cos * pitch_cos * yaw_sin - roll_sin * pitch_sin * yaw_cos,
+        )
 
     @staticmethod
     def from_axis_and_angle(
@@ -284,8 +353,23 @@ class EulerOrientation(Generic[InFrame]):
 
         Returns: An EulerOrientation representing the requested rotation.
         """
-        orientation_tuple = orientation.as_tuple()
-
-        euler: tuple[float] = transforms3d.euler.quat2euler(orientation_tuple, axes="rzyx")
-
-        return EulerOrientation(euler[2], euler[1], euler[0])
+        w, x, y, z = orientation.as_tuple()
+
+        # Only the rotation matrix entries needed for the rotating-frame z-y-x decomposition are
+        # computed; this mirrors transforms3d's quat2euler(..., axes="rzyx") including its handling
+        # of gimbal lock.
+        m00 = 1.0 - 2.0 * (y * y + z * z)
+        m10 = 2.0 * (x * y + w * z)
+        m20 = 2.0 * (x * z - w * y)
+        pitch_cos = sqrt(m00 * m00 + m10 * m10)
+        pitch = atan2(-m20, pitch_cos)
+
+        if pitch_cos > _GIMBAL_LOCK_EPSILON:
+            roll = atan2(2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y))
+            yaw = atan2(m10, m00)
+        else:
+            # Roll and yaw share an axis; attribute the whole rotation to roll
+            roll = atan2(2.0 * (w * x - y * z), 1.0 - 2.0 * (x * x + z * z))
+            yaw = 0.0
+
+        return EulerOrientation(roll, pitch, yaw)
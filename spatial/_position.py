@@ -1,6 +1,20 @@
 import math
 from dataclasses import dataclass
-from typing import Any, Collection, Generic, Tuple, Type, TypeVar, overload
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
+
+import numpy as np
+import numpy.typing as npt
 
 from project_otto.config_deserialization import PrimitiveConfigType
 from project_otto.config_deserialization.utilities import assert_is_list
@@ -27,6 +41,9 @@ class Position(Generic[InFrame]):
         z: Z-coordinate of this Position (Up/Down)
     """
 
+    # "_array" is a cache rather than a dataclass field, so it takes no part in eq/hash/repr
+    __slots__ = ("x", "y", "z", "_array")
+
     x: float
     y: float
     z: float
@@ -48,15 +65,45 @@ class Position(Generic[InFrame]):
             self.z,
         )
 
+    def as_array(self) -> npt.NDArray[np.float64]:
+        """
+        Extract the raw values associated with this Position as a ``(3,)`` array.
+
+        The same caveats as for :meth:`as_tuple` apply. The array is built on first use and
+        cached, as the Position is immutable; it is read-only.
+        """
+        array: Optional[npt.NDArray[np.float64]] = getattr(self, "_array", None)
+        if array is None:
+            array = np.array((self.x, self.y, self.z), dtype=np.float64)
+            array.flags.writeable = False
+            object.__setattr__(self, "_array", array)
+        return array
+
+    def __getstate__(self) -> Tuple[float, float, float]:
+        """
+        Returns the coordinates, for copy and pickle.
+        """
+        return (self.x, self.y, self.z)
+
+    def __setstate__(self, state: Tuple[float, float, float]):
+        """
+        Restores the coordinates returned by __getstate__.
+        """
+        x, y, z = state
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+
     @staticmethod
     def interpolate(
         alpha: float, xs: Tuple["Position[InFrame]", "Position[InFrame]"]
     ) -> "Position[InFrame]":
         """Returns: the position obtained by linearly interpolating between xs_0 and xs_1."""
         a, b = xs
-        a_weight, b_weight = 1.0 - alpha, alpha
-        return Position.from_values(
-            [a_weight * a_i + b_weight * b_i for a_i, b_i in zip(a.as_tuple(), b.as_tuple())]
+        return Position(
+            a.x + alpha * (b.x - a.x),
+            a.y + alpha * (b.y - a.y),
+            a.z + alpha * (b.z - a.z),
         )
 
     @staticmethod
@@ -67,7 +114,8 @@ class Position(Generic[InFrame]):
     @staticmethod
     def distance(a: "Position[InFrame]", b: "Position[InFrame]") -> float:
         """Returns: the distance between of a and b."""
-        return math.sqrt(sum([(a_i - b_i) ** 2 for a_i, b_i in zip(a.as_tuple(), b.as_tuple())]))
+        dx, dy, dz = a.x - b.x, a.y - b.y, a.z - b.z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     @staticmethod
     def from_values(
@@ -82,14 +130,18 @@ class Position(Generic[InFrame]):
             in_frame: An optional type hint (class type) to constrain the frame of the returned
                 Position.
         """
+        if isinstance(values, np.ndarray) and values.shape == (3,):
+            x, y, z = values.tolist()
+            return Position(x, y, z)
+
         if len(values) != 3:
             raise ValueError(
                 "expected position as a three-tuple (x, y, z), "
                 + f"got object with length {len(values)}"
             )
 
-        values_tuple = tuple(values)
-        return Position(values_tuple[0], values_tuple[1], values_tuple[2])
+        x, y, z = values
+        return Position(x, y, z)
 
     @staticmethod
     def of_origin() -> "Position[InFrame]":
@@ -148,12 +200,10 @@ class Position(Generic[InFrame]):
             If a Position is passed in, returns a Vector representing the difference between this
             position and the passed position.
         """
-        if isinstance(other, self.__class__):
-            return Vector[InFrame](self.x - other.x, self.y - other.y, self.z - other.z)
-        elif isinstance(other, Vector):
-            return Position[InFrame](self.x - other.x, self.y - other.y, self.z - other.z)
-        else:
+        subtract = _SUBTRACT_DISPATCH.get(type(other))
+        if subtract is None:
             return NotImplemented
+        return subtract(self, other)
 
     @classmethod
     def parse_from_config_primitive(cls, value: PrimitiveConfigType) -> "Position[InFrame]":
@@ -167,3 +217,19 @@ class Position(Generic[InFrame]):
         """
         values_list = assert_is_list(value, float)
         return Position.from_values(values_list)
+
+
+def _subtract_position(position: Position[Any], other: Position[Any]) -> Vector[Any]:
+    return Vector(position.x - other.x, position.y - other.y, position.z - other.z)
+
+
+def _subtract_vector(position: Position[Any], other: Vector[Any]) -> Position[Any]:
+    return Position(position.x - other.x, position.y - other.y, position.z - other.z)
+
+
+# Position.__sub__ implementations keyed on the exact type of the right-hand operand. Neither
+# Position nor Vector is subclassed, so this replaces the isinstance chain one-for-one.
+_SUBTRACT_DISPATCH: Dict[type, Callable[[Position[Any], Any], Any]] = {
+    Position: _subtract_position,
+    Vector: _subtract_vector,
+}
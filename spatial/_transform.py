@@ -1,6 +1,6 @@
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, List, Sequence, TypeVar
 
-import transforms3d  # type: ignore
+import numpy as np
 from numpy.typing import NDArray
 
 from ._frame import Frame
@@ -18,21 +18,42 @@ SourceFrame = TypeVar("SourceFrame", bound="Frame")
 TargetFrame = TypeVar("TargetFrame", bound="Frame")
 NewTargetFrame = TypeVar("NewTargetFrame", bound="Frame")
 
+# How far the squared norm of a quaternion product may drift from one before it is re-normalized
+_NORM_DRIFT_TOLERANCE = 1e-12
+
 
 def _rotate_vector(vector: Vector[Any], rotation: Orientation[Any]) -> Vector[Any]:
-    rotated_coords: NpArray = transforms3d.quaternions.rotate_vector(
-        vector.as_tuple(), rotation.as_tuple()
+    # Equivalent to q * v * q^-1 for a unit quaternion q, in the cheaper Rodrigues form
+    # v + w * t + q_xyz x t, where t = 2 * (q_xyz x v)
+    rw, rx, ry, rz = rotation.as_tuple()
+    vx, vy, vz = vector.as_tuple()
+    tx = 2.0 * (ry * vz - rz * vy)
+    ty = 2.0 * (rz * vx - rx * vz)
+    tz = 2.0 * (rx * vy - ry * vx)
+    return Vector(
+        vx + rw * tx + (ry * tz - rz * ty),
+        vy + rw * ty + (rz * tx - rx * tz),
+        vz + rw * tz + (rx * ty - ry * tx),
     )
-    return Vector.from_values(rotated_coords)
 
 
 def _rotate_orientation(
     initial_orientation: Orientation[Any], rotation: Orientation[Any]
 ) -> Orientation[Any]:
-    rotated_coords: NpArray = transforms3d.quaternions.qmult(
-        initial_orientation.as_tuple(), rotation.as_tuple()
-    )
-    return Orientation.from_values(rotated_coords)
+    # Hamilton product initial_orientation * rotation, written out on floats to avoid building
+    # intermediate NumPy arrays for a 4-element operation
+    aw, ax, ay, az = initial_orientation.as_tuple()
+    bw, bx, by, bz = rotation.as_tuple()
+    w = aw * bw - ax * bx - ay * by - az * bz
+    x = aw * bx + ax * bw + ay * bz - az * by
+    y = aw * by - ax * bz + ay * bw + az * bx
+    z = aw * bz + ax * by - ay * bx + az * bw
+
+    # The product of two unit quaternions is unit up to rounding error, so only pay for
+    # normalization once that error has accumulated over a chain of compositions
+    if abs(w * w + x * x + y * y + z * z - 1.0) > _NORM_DRIFT_TOLERANCE:
+        return Orientation(w, x, y, z)
+    return Orientation._from_unit(w, x, y, z)
 
 
 class Transform(Generic[SourceFrame, TargetFrame]):
@@ -109,13 +130,24 @@ class Transform(Generic[SourceFrame, TargetFrame]):
 
         Returns: a position equivalent to the original, but in the new frame
         """
-        un_rotated: Vector[SourceFrame] = Vector(
-            position.x - self.translation.x,
-            position.y - self.translation.y,
-            position.z - self.translation.z,
+        # Translate, then rotate by the reverse rotation, fused so that no intermediate Vector or
+        # conjugate Orientation is built. This is _rotate_vector with the quaternion's vector part
+        # negated, which is the conjugate of a unit quaternion.
+        rw, rx, ry, rz = self.rotation.as_tuple()
+        rx, ry, rz = -rx, -ry, -rz
+        translation = self.translation
+        vx = position.x - translation.x
+        vy = position.y - translation.y
+        vz = position.z - translation.z
+
+        tx = 2.0 * (ry * vz - rz * vy)
+        ty = 2.0 * (rz * vx - rx * vz)
+        tz = 2.0 * (rx * vy - ry * vx)
+        return Position(
+            vx + rw * tx + (ry * tz - rz * ty),
+            vy + rw * ty + (rz * tx - rx * tz),
+            vz + rw * tz + (rx * ty - ry * tx),
         )
-        rotated = self.apply_to_vector(un_rotated)
-        return Position(*rotated.as_tuple())
 
     def apply_to_linear_uncertainty(
         self, uncertainty: LinearUncertainty[SourceFrame]
@@ -132,7 +164,10 @@ class Transform(Generic[SourceFrame, TargetFrame]):
         Returns: an uncertainty equivalent to the original, but in the new frame
         """
         rotation_matrix = self.rotation.as_matrix()
-        return LinearUncertainty(rotation_matrix @ uncertainty.covariance @ rotation_matrix.T)
+        # R C R^T as a single einsum; at 3x3 this avoids an intermediate array and a second matmul
+        return LinearUncertainty(
+            np.einsum("ij,jk,lk->il", rotation_matrix, uncertainty.covariance, rotation_matrix)
+        )
 
     def apply_to_measured_position(
         self, measurement: MeasuredPosition[SourceFrame]
@@ -152,6 +187,72 @@ class Transform(Generic[SourceFrame, TargetFrame]):
             self.apply_to_linear_uncertainty(measurement.uncertainty),
         )
 
+    def apply_to_positions_array(self, positions: NpArray) -> NpArray:
+        """
+        Transforms a batch of positions into equivalent ones in the target frame.
+
+        Equivalent to calling :meth:`apply_to_position` on each row, but builds the rotation matrix
+        once and applies it to every point in a single matrix product.
+
+        This function loses frame-correctness guarantees and should only be used where the number
+        of points makes per-Position calls a bottleneck.
+
+        Args:
+            positions: an (N, 3) array of ``(x, y, z)`` rows in the source frame
+
+        Returns: an (N, 3) array of the transformed positions, in the same row order
+        """
+        # Positions are rotated by the conjugate rotation, i.e. by the transposed rotation matrix.
+        # For row vectors, p @ R is the same as applying R^T to each column vector p.
+        return (positions - self.translation.as_tuple()) @ self.rotation.as_matrix()
+
+    def apply_to_covariances_array(self, covariances: NpArray) -> NpArray:
+        """
+        Transforms a batch of covariance matrices into equivalent ones in the target frame.
+
+        Equivalent to calling :meth:`apply_to_linear_uncertainty` on each matrix, but rotates the
+        whole stack with a single einsum.
+
+        This function loses frame-correctness guarantees and should only be used where the number
+        of uncertainties makes per-LinearUncertainty calls a bottleneck.
+
+        Args:
+            covariances: an (N, 3, 3) stack of covariance matrices in the source frame
+
+        Returns: an (N, 3, 3) stack of the transformed covariance matrices, in the same order
+        """
+        rotation_matrix = self.rotation.as_matrix()
+        return np.einsum("ij,njk,lk->nil", rotation_matrix, covariances, rotation_matrix)
+
+    def apply_to_measured_positions(
+        self, measurements: Sequence[MeasuredPosition[SourceFrame]]
+    ) -> "List[MeasuredPosition[TargetFrame]]":
+        """
+        Transforms a batch of measured positions into equivalent ones in the target frame.
+
+        Equivalent to calling :meth:`apply_to_measured_position` on each element, but transforms all
+        positions and all covariance matrices with one batched NumPy operation each.
+
+        Args:
+            measurements: measurements to transform
+
+        Returns: measurements equivalent to the originals, but in the new frame, in the same order
+        """
+        if not measurements:
+            return []
+
+        positions = self.apply_to_positions_array(
+            np.array([measurement.position.as_tuple() for measurement in measurements])
+        )
+        covariances = self.apply_to_covariances_array(
+            np.stack([measurement.uncertainty.covariance for measurement in measurements])
+        )
+
+        return [
+            MeasuredPosition(Position(*position), LinearUncertainty(covariance))
+            for position, covariance in zip(positions.tolist(), covariances)
+        ]
+
     def get_inverse(self) -> "Transform[TargetFrame, SourceFrame]":
         """
         Returns the inverse of this transform.
@@ -180,8 +281,14 @@ class Transform(Generic[SourceFrame, TargetFrame]):
         """
         Computes a new transform equivalent to applying this transform followed by "other".
         """
-        # TODO: remove typing ignores
-        new_translation = self.get_inverse().apply_to_position(other.translation)
+        # The other transform's origin, expressed in this transform's source frame. This is what
+        # applying the inverse of this transform to it would produce, without building the inverse.
+        offset = _rotate_vector(Vector(*other.translation.as_tuple()), self.rotation)
+        new_translation: Position[SourceFrame] = Position(
+            self.translation.x + offset.x,
+            self.translation.y + offset.y,
+            self.translation.z + offset.z,
+        )
         new_rotation: Orientation[SourceFrame] = _rotate_orientation(
             self.rotation,
             other.rotation,
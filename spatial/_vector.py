@@ -28,6 +28,8 @@ class Vector(Generic[InFrame]):
         z: Z-coordinate of this Vector
     """
 
+    __slots__ = ("x", "y", "z")
+
     x: float
     y: float
     z: float
@@ -65,8 +67,8 @@ class Vector(Generic[InFrame]):
                 f"expected vector as a three-tuple (x, y, z), got object with length {len(values)}"
             )
 
-        values_tuple = tuple(values)
-        return Vector(values_tuple[0], values_tuple[1], values_tuple[2])
+        x, y, z = values
+        return Vector(x, y, z)
 
     def __add__(self, vector: Any) -> "Vector[InFrame]":
         """
@@ -132,4 +134,4 @@ class Vector(Generic[InFrame]):
         """
         Returns the magnitude of this vector.
         """
-        return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return math.hypot(self.x, self.y, self.z)
@@ -10,6 +10,7 @@ from ._target import DetectedTargetPosition, DetectedTargetRegion
 from ._target_detector import LightningTargetDetector, TargetDetector
 from ._target_prune import prune_invalid_targets
 from ._target_prune_configuration import TargetPruneConfiguration
+from ._target_region_array import DetectedTargetRegionArray
 from ._target_set import ImageDetectedTargetSet
 from ._world_detected_target_set import WorldDetectedTargetSet
 
@@ -20,6 +21,7 @@ __all__ = [
     "DetectorConfiguration",
     "DetectedTargetPosition",
     "DetectedTargetRegion",
+    "DetectedTargetRegionArray",
     "ImageDetectedTargetSet",
     "LightningTargetDetector",
     "prune_invalid_targets",
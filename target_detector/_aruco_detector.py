@@ -1,4 +1,4 @@
-from typing import Any, List, Tuple, TypeVar
+from typing import Any, List, Set, Tuple, TypeVar
 
 import numpy as np
 import numpy.typing as npt
@@ -45,6 +45,10 @@ class ArucoDetector(TargetDetector):
     def __init__(self, team_color: TeamColor):
         self.team_color = team_color
 
+        self._dictionary: Any = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_6X6_250)
+        self._parameters: Any = cv2.aruco.DetectorParameters_create()
+        self._parameters.adaptiveThreshConstant = 10
+
     def detect_targets(
         self, framesets: List[Frameset[InFrame, TimeType]]
     ) -> List[ImageDetectedTargetSet]:
@@ -56,18 +60,13 @@ class ArucoDetector(TargetDetector):
         Returns:
             Rectangle with 0 area; all four corners are at a specific corner of the ArUco target.
         """
-        dictionary: Any = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_6X6_250)
-
-        parameters: Any = cv2.aruco.DetectorParameters_create()
-        parameters.adaptiveThreshConstant = 10
-
         detected_target_sets: List[ImageDetectedTargetSet] = []
         for frameset in framesets:
 
             grey_frame: npt.NDArray[np.uint8] = cv2.cvtColor(frameset.color, cv2.COLOR_BGR2GRAY)
 
             aruco_corners, aruco_ids, _rejected_img_points = detect_markers(
-                grey_frame, dictionary, parameters=parameters
+                grey_frame, self._dictionary, parameters=self._parameters
             )
 
             # estimate_pose_single_markers will throw error if list is empty
@@ -75,31 +74,25 @@ class ArucoDetector(TargetDetector):
                 detected_target_sets.append(ImageDetectedTargetSet(set()))
                 continue
 
-            detected_target_regions: List[DetectedTargetRegion] = []
-            for corner in aruco_corners:
-                # ul = IntPoint(int(corner[0, 0, 0]), int(corner[0, 0, 1]))
-                # ur = IntPoint(int(corner[0, 1, 0]), int(corner[0, 1, 1]))
-                # br = IntPoint(int(corner[0, 2, 0]), int(corner[0, 2, 1]))
-                # bl = IntPoint(int(corner[0, 3, 0]), int(corner[0, 3, 1]))
-
-                mean_x = np.mean(corner[0, :, 0])
-                mean_y = np.mean(corner[0, :, 1])
-
-                width: float = np.max(corner[0, :, 0]) - np.min(corner[0, :, 0])
-                height: float = np.max(corner[0, :, 1]) - np.min(corner[0, :, 1])
-
-                half_width = width / 2
-                half_height = height / 2
-
-                rectangle = Rectangle.from_point(
-                    IntPoint(int(mean_x - half_width), int(mean_y - half_height)),
-                    int(width),
-                    int(height),
-                )
-                detected_target_regions.append(
-                    DetectedTargetRegion(1.0, TeamColor.flip(self.team_color), rectangle)
+            # Each marker's corners come back as a (1, 4, 2) array; reduce all markers at once
+            corners: TensorFloat = np.concatenate(aruco_corners)
+            mins = corners.min(axis=1)
+            maxes = corners.max(axis=1)
+            means = corners.mean(axis=1)
+
+            sizes = maxes - mins
+            # Truncating casts, matching int() on each value
+            upper_lefts = (means - sizes / 2).astype(np.int32).tolist()
+            int_sizes = sizes.astype(np.int32).tolist()
+
+            target_color = TeamColor.flip(self.team_color)
+            detected_target_regions: Set[DetectedTargetRegion] = {
+                DetectedTargetRegion(
+                    1.0, target_color, Rectangle.from_point(IntPoint(x, y), width, height)
                 )
+                for (x, y), (width, height) in zip(upper_lefts, int_sizes)
+            }
 
-            detected_target_sets.append(ImageDetectedTargetSet(set(detected_target_regions)))
+            detected_target_sets.append(ImageDetectedTargetSet(detected_target_regions))
 
         return detected_target_sets
@@ -29,13 +29,24 @@ def _median_depth(depth_rect: npt.NDArray[np.uint16]) -> Optional[float]:
     """
     if depth_rect.size == 0:
         return None
-    proportion_nan_zero = (
-        np.isnan(depth_rect).sum() + np.count_nonzero(depth_rect == 0)
-    ) / depth_rect.size
+    # Throw out zeroes, then NaN's, before median calculation. Integer depth (the RealSense's native
+    # uint16) cannot hold NaN, so that pass is skipped entirely in the common case.
+    valid = depth_rect[depth_rect != 0]
+    if valid.dtype.kind == "f":
+        valid = valid[~np.isnan(valid)]
+
+    proportion_nan_zero = (depth_rect.size - valid.size) / depth_rect.size
     if proportion_nan_zero > _MAX_INVALID_DEPTH_PERCENTAGE:
         return None
-    # Throw out NaN's and zeroes before median calculation
-    return float(np.nanmedian(depth_rect[depth_rect != 0]))
+
+    # Select the middle element(s) in linear time rather than sorting. "valid" is already a copy
+    # from the masking above, so it can be partitioned in place.
+    middle = valid.size // 2
+    if valid.size % 2 == 1:
+        valid.partition(middle)
+        return float(valid[middle])
+    valid.partition((middle - 1, middle))
+    return (float(valid[middle - 1]) + float(valid[middle])) / 2
 
 
 @dataclass
@@ -1,15 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Sequence, Set, Tuple, TypeVar
+from typing import Any, List, Optional, Sequence, Set, Tuple, TypeVar
 
-import cv2  # type: ignore
 import numpy as np
-import numpy.typing as npt
 import pytorch_lightning as pl
 import torch
 from lightning_models import losses
 from lightning_models.models import get_model_by_name
 from lightning_models.models.model_base import ModelBase
-from torch.nn.functional import max_pool2d  # pyright: ignore[reportUnknownVariableType]
+from torch.nn.functional import (
+    interpolate,
+    max_pool2d,  # pyright: ignore[reportUnknownVariableType]
+)
 
 from project_otto.geometry import IntRectangle
 from project_otto.image import Frameset
@@ -59,8 +60,18 @@ class LightningTargetDetector(TargetDetector):
         self._config = config
         self._model = model.type(torch_dtypes[config.precision]).eval()
 
+        # Host-side uint8 staging buffer for input images, pinned when a GPU is used so the upload
+        # can be issued asynchronously on a dedicated copy stream.
+        self._staging: Optional[torch.Tensor] = None
+        self._copy_stream: Optional[torch.cuda.Stream] = None
+
+        # Clamp bounds for detected boxes, cached for the most recent set of frame sizes
+        self._scale_bounds_key: Tuple[Tuple[int, int], ...] = ()
+        self._scale_bounds_tensor = torch.empty((0, 2), dtype=torch.int64)
+
         if config.gpus > 0:
             _ = self._model.cuda()
+            self._copy_stream = torch.cuda.Stream()
 
     def detect_targets(
         self, framesets: Sequence[Frameset[InFrame, TimeType]]
@@ -69,22 +80,20 @@ class LightningTargetDetector(TargetDetector):
         Takes color frame of frameset, runs it through ML model, draws rectangles around targets.
 
         Args:
-            framesets: Framesets to extract targets from. Color frame should have dim (h, w, 3).
+            framesets: Framesets to extract targets from. Color frame should have dim (h, w, 3),
+                and be the same size across all framesets.
         Returns:
             ImageDetectedTargetSet containing targets of both colors.
         """
-        # TODO: This enforcer may be eating a significant amount of time
         # Context enforcer
-        if (0.0 * torch.empty(1, requires_grad=True)).requires_grad:
+        if torch.is_grad_enabled():
             raise RuntimeError("Expected method to be run within torch.no_grad() context.")
 
-        osizes = []
-        rsize = (self._config.image_height, self._config.image_width)
-        data: torch.Tensor = torch.empty(
-            (len(framesets), 3, self._config.image_width, self._config.image_height)
-        )
+        if not framesets:
+            return []
 
-        for i, frameset in enumerate(framesets):
+        osizes = []
+        for frameset in framesets:
             if len(frameset.color.shape) != 3:
                 raise ValueError(
                     f"Expected color frame array with 3 dimensions, got {len(frameset.color.shape)}"
@@ -96,30 +105,43 @@ class LightningTargetDetector(TargetDetector):
                     + f"{frameset.color.shape[2]}."
                 )
 
-            osizes.append(frameset.color.shape)
-
-            # TODO: Evaluate best compromise between interpolation quality and speed
-            color = frameset.color
-            color: npt.NDArray[np.uint8] = cv2.resize(
-                color, dsize=rsize, interpolation=cv2.INTER_NEAREST
-            )
+            if frameset.color.shape != framesets[0].color.shape:
+                raise ValueError(
+                    "Expected color frames of the same shape, got "
+                    + f"{framesets[0].color.shape} and {frameset.color.shape}."
+                )
 
-            color: npt.NDArray[np.uint8] = cv2.cvtColor(color, cv2.COLOR_BGR2RGB)
-            # H,W,C -> C,H,W
-            color = np.swapaxes(color, 0, 2)
-            color = np.swapaxes(color, 1, 2)
+            osizes.append(frameset.color.shape)
 
-            data[i] = torch.from_numpy(color)
+        # Raw BGR frames are copied once into the staging buffer and uploaded as-is; resizing,
+        # channel reordering and normalization all happen on the device.
+        staging = self._get_staging_buffer((len(framesets),) + framesets[0].color.shape)
+        np.stack([frameset.color for frameset in framesets], out=staging.numpy())
+
+        if self._copy_stream is not None:
+            with torch.cuda.stream(self._copy_stream):
+                data = staging.cuda(non_blocking=True)
+            compute_stream = torch.cuda.current_stream()
+            compute_stream.wait_stream(self._copy_stream)
+            data.record_stream(compute_stream)
+        else:
+            data = staging
 
-        if self._config.gpus > 0:
-            data = data.cuda()
+        # B,H,W,C -> B,C,H,W
+        data = data.permute(0, 3, 1, 2).to(torch_dtypes[self._config.precision])
 
-        data = data.to(torch_dtypes[self._config.precision])
+        # TODO: Evaluate best compromise between interpolation quality and speed
+        data = interpolate(
+            data, size=(self._config.image_height, self._config.image_width), mode="nearest"
+        )
 
-        data = data / 255
+        # BGR -> RGB, done on the resized image so fewer pixels are copied. The reorder also yields
+        # the contiguous NCHW layout the model expects, which is then normalized in place.
+        data = data[:, [2, 1, 0]].contiguous()
+        data /= 255
 
+        # Left on the device in model precision; only the values at detected peaks are copied back
         prediction: torch.Tensor = self._model(data, infer=True)
-        prediction = prediction.to(torch.float).cpu()
 
         # Looks for both red and blue plates
         target_heatmap = prediction[:, :2, :, :]
@@ -139,6 +161,32 @@ class LightningTargetDetector(TargetDetector):
             )
         return image_detected_target_sets
 
+    def _get_staging_buffer(self, shape: Tuple[int, ...]) -> torch.Tensor:
+        """
+        Returns the reusable host buffer for a batch of raw color frames of the given shape.
+
+        The buffer is reallocated only when the batch size or frame resolution changes. It is
+        page-locked when running on the GPU, which allows the host-to-device copy to run
+        asynchronously.
+        """
+        if self._staging is None or tuple(self._staging.shape) != shape:
+            self._staging = torch.empty(
+                shape,
+                dtype=torch.uint8,
+                pin_memory=self._config.gpus > 0,
+            )
+        return self._staging
+
+    def _scale_bounds(self, scale_dims: Sequence[Tuple[int, int]]) -> torch.Tensor:
+        """
+        Returns a (b, 2) tensor of each image's (height, width), reused while sizes are unchanged.
+        """
+        key = tuple((dims[0], dims[1]) for dims in scale_dims)
+        if key != self._scale_bounds_key:
+            self._scale_bounds_key = key
+            self._scale_bounds_tensor = torch.tensor(key, dtype=torch.int64)
+        return self._scale_bounds_tensor
+
     # TODO: Consider
     #       1. Return union of red and blue sets
     #       2. Return list of tuple rather than tuple of list
@@ -170,52 +218,68 @@ class LightningTargetDetector(TargetDetector):
         plate_sets_red: List[Set[DetectedTargetRegion]] = [set() for _ in range(heatmap.shape[0])]
         plate_sets_blue: List[Set[DetectedTargetRegion]] = [set() for _ in range(heatmap.shape[0])]
 
-        # Get discrete local maxima to extract cohesive "blobs" from heatmap
+        # Get discrete local maxima to extract cohesive "blobs" from heatmap. The threshold is
+        # compared in single precision, as rounding it to the model's precision would shift it.
         peaks = (
             heatmap
-            * torch.gt(heatmap, self._config.confidence_threshold)
+            * torch.gt(heatmap.float(), self._config.confidence_threshold)
             * torch.eq(heatmap, max_pool2d(heatmap, (3, 3), stride=1, padding=1))
         )
         peak_indices = torch.nonzero(peaks)
 
-        def clamp_to_height(y: int, b: int) -> int:
-            return min(max(y, 0), scale_dims[b][0])
-
-        def clamp_to_width(x: int, b: int) -> int:
-            return min(max(x, 0), scale_dims[b][1])
-
-        # Terrible idx_idx to satiate typechecker
-        for idx_idx in range(peak_indices.size()[0]):
-            b_idx = int(peak_indices[idx_idx, 0].item())
-            c_idx = int(peak_indices[idx_idx, 1].item())
-            y_idx = peak_indices[idx_idx, 2].item()
-            x_idx = peak_indices[idx_idx, 3].item()
-            confidence = float(heatmap[b_idx, c_idx, y_idx, x_idx].float().item())
-            y_c = (float(y_idx) + float(offset_map[b_idx, 0, y_idx, x_idx].item())) / float(
-                heatmap.shape[2]
-            )
-            x_c = (float(x_idx) + float(offset_map[b_idx, 1, y_idx, x_idx].item())) / float(
-                heatmap.shape[3]
+        # Gather every peak's values at once on the maps' device, then copy just those to the host.
+        # Arithmetic is done in double precision, as it was when each value was pulled out
+        # individually as a Python float.
+        # The indices travel in the same (9, P) double tensor as the values (exactly, since they
+        # are far below 2**53), so the whole result needs a single device-to-host copy.
+        b_idx, c_idx, y_idx, x_idx = peak_indices.unbind(1)
+        peak_data = torch.stack(
+            (
+                b_idx.double(),
+                c_idx.double(),
+                y_idx.double(),
+                x_idx.double(),
+                heatmap[b_idx, c_idx, y_idx, x_idx].double(),
+                offset_map[b_idx, 0, y_idx, x_idx].double(),
+                offset_map[b_idx, 1, y_idx, x_idx].double(),
+                size_map[b_idx, 0, y_idx, x_idx].double(),
+                size_map[b_idx, 1, y_idx, x_idx].double(),
             )
-            h = float(size_map[b_idx, 0, y_idx, x_idx].item())
-            w = float(size_map[b_idx, 1, y_idx, x_idx].item())
-
-            x0 = int((x_c - 0.5 * w) * scale_dims[b_idx][1])
-            y0 = int((y_c - 0.5 * h) * scale_dims[b_idx][0])
-            x1 = int((x_c + 0.5 * w) * scale_dims[b_idx][1])
-            y1 = int((y_c + 0.5 * h) * scale_dims[b_idx][0])
-
-            x0 = clamp_to_width(x0, b_idx)
-            y0 = clamp_to_height(y0, b_idx)
-            x1 = clamp_to_width(x1, b_idx)
-            y1 = clamp_to_height(y1, b_idx)
+        ).cpu()
+        b_col, c_col, y_col, x_col, confidences, y_offsets, x_offsets, h, w = peak_data
+        b_idx = b_col.long()
+
+        y_c = (y_col + y_offsets) / heatmap.shape[2]
+        x_c = (x_col + x_offsets) / heatmap.shape[3]
+        half_h = 0.5 * h
+        half_w = 0.5 * w
+
+        # Per-image clamp bounds, looked up once per peak by index rather than per coordinate
+        heights, widths = self._scale_bounds(scale_dims)[b_idx].unbind(1)
+
+        def to_pixels(values: torch.Tensor, limits: torch.Tensor) -> torch.Tensor:
+            # Truncate like int(), then clamp into [0, limit]
+            return torch.minimum(torch.clamp((values * limits).long(), min=0), limits)
+
+        boxes = torch.stack(
+            (
+                to_pixels(x_c - half_w, widths),
+                to_pixels(y_c - half_h, heights),
+                to_pixels(x_c + half_w, widths),
+                to_pixels(y_c + half_h, heights),
+            ),
+            dim=1,
+        )
 
-            if c_idx == 0:
-                plate_sets_red[b_idx].add(
+        for b, c, confidence, (x0, y0, x1, y1) in zip(
+            b_idx.tolist(), c_col.long().tolist(), confidences.tolist(), boxes.tolist()
+        ):
+            if c == 0:
+                plate_sets_red[b].add(
                     DetectedTargetRegion(confidence, TeamColor.RED, IntRectangle(x0, y0, x1, y1))
                 )
             else:
-                plate_sets_blue[b_idx].add(
+                plate_sets_blue[b].add(
                     DetectedTargetRegion(confidence, TeamColor.BLUE, IntRectangle(x0, y0, x1, y1))
                 )
 
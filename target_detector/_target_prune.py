@@ -1,9 +1,10 @@
 """Function to filter out targets."""
 import logging
-from typing import Set
+from typing import Tuple
+
+import numpy as np
 
 from project_otto.robomaster import TeamColor
-from project_otto.target_detector._target import DetectedTargetRegion
 from project_otto.target_detector._target_prune_configuration import TargetPruneConfiguration
 from project_otto.target_detector._target_set import ImageDetectedTargetSet
 
@@ -12,7 +13,7 @@ def prune_invalid_targets(
     current_team_color: TeamColor,
     targets: ImageDetectedTargetSet,
     config: TargetPruneConfiguration,
-) -> ImageDetectedTargetSet:
+) -> Tuple[ImageDetectedTargetSet, ImageDetectedTargetSet]:
     """
     Filters targets based on rectangle size and the team color.
 
@@ -26,21 +27,24 @@ def prune_invalid_targets(
         config: config class for this method
 
     Returns:
-        a set of targets that are of type ImageDetectedTargetSet
+        a tuple of (kept targets, rejected targets), both of type ImageDetectedTargetSet
     """
-    size_rejection_count = 0
-    correct_targets: Set[DetectedTargetRegion] = set()
-    for item in targets.plates:
-        if current_team_color != item.color:
-            length_rect = item.rectangle.height
-            breadth_rect = item.rectangle.width
-            if breadth_rect < config.minimum_width or length_rect < config.minimum_height:
-                size_rejection_count += 1
-                continue
-
-            correct_targets.add(item)
+    if not targets.plates:
+        return targets, ImageDetectedTargetSet(set())
+
+    regions = targets.to_arrays()
+
+    opposing_color = regions.color != current_team_color.value
+    large_enough = (regions.widths >= config.minimum_width) & (
+        regions.heights >= config.minimum_height
+    )
+    kept = opposing_color & large_enough
 
+    size_rejection_count = int(np.count_nonzero(opposing_color & ~large_enough))
     if size_rejection_count > 0:
-        logging.info(f"Rejected {size_rejection_count} detections due to size constraint")
+        logging.info("Rejected %d detections due to size constraint", size_rejection_count)
 
-    return ImageDetectedTargetSet(correct_targets)
+    return (
+        ImageDetectedTargetSet.from_arrays(regions[kept]),
+        ImageDetectedTargetSet.from_arrays(regions[~kept]),
+    )
@@ -0,0 +1,103 @@
+"""Column-wise representation of a collection of detected target regions."""
+from dataclasses import dataclass
+from typing import Iterable, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ._target import DetectedTargetRegion
+
+
+@dataclass(frozen=True)
+class DetectedTargetRegionArray:
+    """
+    A collection of :class:`DetectedTargetRegion`, stored as parallel NumPy arrays.
+
+    Intended for batch operations (filtering, IoU) over all regions of a frame, which would
+    otherwise be per-region Python loops. Element ``i`` of every array describes ``regions[i]``;
+    the original region objects are kept so that results can be handed back without rebuilding
+    them.
+
+    Args:
+        regions: the regions described by the arrays
+        x0: left edge of each region's rectangle
+        y0: top edge of each region's rectangle
+        x1: right edge of each region's rectangle
+        y1: bottom edge of each region's rectangle
+        confidence: detection confidence of each region
+        color: :class:`~project_otto.robomaster.TeamColor` value of each region
+    """
+
+    regions: Tuple[DetectedTargetRegion, ...]
+    x0: npt.NDArray[np.int64]
+    y0: npt.NDArray[np.int64]
+    x1: npt.NDArray[np.int64]
+    y1: npt.NDArray[np.int64]
+    confidence: npt.NDArray[np.float64]
+    color: npt.NDArray[np.int64]
+
+    @staticmethod
+    def from_regions(regions: Iterable[DetectedTargetRegion]) -> "DetectedTargetRegionArray":
+        """
+        Builds the column-wise representation of the given regions.
+        """
+        regions_tuple = tuple(regions)
+        x0, y0, x1, y1 = np.array(
+            [
+                (region.rectangle.x0, region.rectangle.y0, region.rectangle.x1, region.rectangle.y1)
+                for region in regions_tuple
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 4).T
+        return DetectedTargetRegionArray(
+            regions_tuple,
+            x0,
+            y0,
+            x1,
+            y1,
+            np.array([region.detection_confidence for region in regions_tuple], dtype=np.float64),
+            np.array([region.color.value for region in regions_tuple], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of regions."""
+        return len(self.regions)
+
+    def __getitem__(self, mask: npt.NDArray[np.bool_]) -> "DetectedTargetRegionArray":
+        """Returns the regions selected by a boolean mask, in their original order."""
+        return DetectedTargetRegionArray(
+            tuple(region for region, keep in zip(self.regions, mask.tolist()) if keep),
+            self.x0[mask],
+            self.y0[mask],
+            self.x1[mask],
+            self.y1[mask],
+            self.confidence[mask],
+            self.color[mask],
+        )
+
+    @property
+    def widths(self) -> npt.NDArray[np.int64]:
+        """The width of each region's rectangle."""
+        return self.x1 - self.x0
+
+    @property
+    def heights(self) -> npt.NDArray[np.int64]:
+        """The height of each region's rectangle."""
+        return self.y1 - self.y0
+
+    def pairwise_iou(self) -> npt.NDArray[np.float64]:
+        """
+        Returns the (N, N) matrix of the IoU of every region's rectangle with every other's.
+
+        Entries for pairs whose union is empty are NaN.
+        """
+        areas = self.widths * self.heights
+        x_overlap = np.minimum.outer(self.x1, self.x1) - np.maximum.outer(self.x0, self.x0)
+        y_overlap = np.minimum.outer(self.y1, self.y1) - np.maximum.outer(self.y0, self.y0)
+        intersection = np.clip(x_overlap, 0, None) * np.clip(y_overlap, 0, None)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return intersection / (np.add.outer(areas, areas) - intersection)
+
+    def to_set(self) -> Set[DetectedTargetRegion]:
+        """Returns the regions as a set."""
+        return set(self.regions)
@@ -3,10 +3,12 @@ import logging
 from dataclasses import dataclass
 from typing import Set, TypeVar
 
-from project_otto.geometry import IntRectangle
+import numpy as np
+
 from project_otto.spatial import Frame
 
 from ._target import DetectedTargetRegion
+from ._target_region_array import DetectedTargetRegionArray
 
 InFrame = TypeVar("InFrame", bound=Frame)
 
@@ -31,14 +33,33 @@ class ImageDetectedTargetSet:
         Returns:
             The set of DetectedPlateRegions satisfying the aforementioned conditions.
         """
-        suppressed_plate_set = set([plate for plate in self.plates])
-        for plate in self.plates:
-            for other in self.plates:
-                if (
-                    plate is not other
-                    and IntRectangle.iou(plate.rectangle, other.rectangle) >= iou_threshold
-                ):
-                    discard_plate = min(plate, other, key=lambda x: x.detection_confidence)
-                    logging.debug(f"Discarded plate during non-max suppression: {discard_plate}")
-                    suppressed_plate_set.discard(discard_plate)
-        return ImageDetectedTargetSet(suppressed_plate_set)
+        regions = self.to_arrays()
+        if len(regions) < 2:
+            return ImageDetectedTargetSet(regions.to_set())
+
+        overlapping = regions.pairwise_iou() >= iou_threshold
+        np.fill_diagonal(overlapping, False)
+
+        # A plate is discarded if it overlaps any plate at least as confident as itself; as with
+        # the pairwise comparison, ties discard both plates
+        confidence = regions.confidence
+        discarded = (overlapping & (confidence[np.newaxis, :] >= confidence[:, np.newaxis])).any(
+            axis=1
+        )
+
+        for plate in regions[discarded].regions:
+            logging.debug("Discarded plate during non-max suppression: %s", plate)
+        return ImageDetectedTargetSet.from_arrays(regions[~discarded])
+
+    def to_arrays(self) -> DetectedTargetRegionArray:
+        """
+        Returns the plates in column-wise form, for batch operations over the whole set.
+        """
+        return DetectedTargetRegionArray.from_regions(self.plates)
+
+    @staticmethod
+    def from_arrays(regions: DetectedTargetRegionArray) -> "ImageDetectedTargetSet":
+        """
+        Constructs a target set from plates in column-wise form.
+        """
+        return ImageDetectedTargetSet(regions.to_set())
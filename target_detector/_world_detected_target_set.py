@@ -1,6 +1,6 @@
 """Target set in the world frame."""
 from dataclasses import dataclass
-from typing import Set
+from typing import Tuple
 
 from project_otto.frames import WorldFrame
 from project_otto.timestamps import JetsonTimestamp, OdometryTimestamp
@@ -16,7 +16,7 @@ class WorldDetectedTargetSet:
     Target set of target regions in the world frame.
     """
 
-    positions: Set[DetectedTargetPosition[WorldFrame]]
+    positions: Tuple[DetectedTargetPosition[WorldFrame], ...]
     jetson_timestamp: JetsonTimestamp
     odometry_timestamp: OdometryTimestamp
 
@@ -37,15 +37,16 @@ class WorldDetectedTargetSet:
         jetson_timestamp = camera_relative_target_set.timestamp
         to_world_transform = to_world_transform_provider.camera_frame_to_world_frame_transform
 
-        positions = set(
-            (
-                DetectedTargetPosition(
-                    target.confidence,
-                    target.color,
-                    to_world_transform.apply_to_measured_position(target.measurement),
-                )
-                for target in camera_relative_target_set.positions
-            )
+        targets = list(camera_relative_target_set.positions)
+        measurements = to_world_transform.apply_to_measured_positions(
+            [target.measurement for target in targets]
+        )
+
+        # The camera relative positions are already distinct, and so are their transformed
+        # counterparts, so there is nothing to deduplicate here
+        positions = tuple(
+            DetectedTargetPosition(target.confidence, target.color, measurement)
+            for target, measurement in zip(targets, measurements)
         )
 
         return WorldDetectedTargetSet(positions, jetson_timestamp, odometry_timestamp)
@@ -1,6 +1,9 @@
 import logging
 from typing import Optional, Sequence, Tuple, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 from project_otto.target_tracker import TrackedTarget
 
 from ._config import TargetSelectorConfiguration
@@ -27,46 +30,58 @@ def select_target(
     Returns:
         The target with the lowest evaluation score, None if no target is valid.
     """
-    target_scores = list(map(lambda target: (target, _evaluate_target(rules, target)), targets))
+    if len(targets) == 0:
+        return None
+
+    scores = _evaluate_targets(rules, targets)
 
-    def _is_under_maximum_score(score: float):
-        return config.maximum_score_threshold is None or score < config.maximum_score_threshold
+    invalid_count = int(np.count_nonzero(np.isnan(scores)))
+    if invalid_count > 0:
+        logging.info("Dropped %d invalid targets", invalid_count)
 
-    valid_targets = [
-        (target, score)
-        for target, score in target_scores
-        if score is not None and _is_under_maximum_score(score)
-    ]
+    if config.maximum_score_threshold is not None:
+        # NaN compares false, so invalid targets stay excluded
+        scores = np.where(scores < config.maximum_score_threshold, scores, np.nan)
 
-    if len(valid_targets) == 0:
+    if np.all(np.isnan(scores)):
         return None
 
-    min_target, _ = min(valid_targets, key=lambda target_score: target_score[1])
-    return min_target
+    return targets[int(np.nanargmin(scores))]
 
 
-def _evaluate_target(
-    rules: Sequence[Tuple[TargetSelectionRule, float]], target: TrackedTarget
-) -> Optional[float]:
+def _evaluate_targets(
+    rules: Sequence[Tuple[TargetSelectionRule, float]], targets: Sequence[TrackedTarget]
+) -> npt.NDArray[np.float64]:
     """
-    Evaluates the score and validity of a given target, lower scores being preferable.
+    Evaluates the scores and validity of the given targets, lower scores being preferable.
 
-    Calculates the weighted sum of scores for the given target using rules from the config.
-    If the target is marked as invalid by any of the rules, then it is invalid.
+    Calculates the weighted sum of scores for each target using rules from the config. If a target
+    is marked as invalid by any of the rules, then it is invalid.
 
     Args:
         rules: A list of scoring rules and their relative weights.
-        target: Target to evaluate
+        targets: Targets to evaluate
 
     Returns:
-        Weighted sum of scores using the rules and weights from the config, or None
-        if the target is invalid.
+        Weighted sum of scores for each target, in order, using the rules and weights from the
+        config; NaN where the target is invalid.
     """
-    weighted_score = 0
-    for rule, weight in rules:
-        rule_score = rule.get_score(target)
-        if rule_score is None:
-            logging.info("Dropped invalid target")
-            return None
-        weighted_score += weight * rule_score
-    return weighted_score
+    weighted_scores = np.zeros(len(targets), dtype=np.float64)
+    valid = np.ones(len(targets), dtype=np.bool_)
+
+    # Rules which may invalidate targets run first, so that the remaining rules only score the
+    # targets which are still valid
+    for rule, weight in sorted(rules, key=lambda rule_weight: not rule_weight[0].can_invalidate):
+        if valid.all():
+            # An invalid (NaN) score from any rule makes the whole sum NaN, regardless of weight
+            weighted_scores += weight * rule.get_scores(targets)
+        elif valid.any():
+            valid_indices = np.flatnonzero(valid)
+            weighted_scores[valid_indices] += weight * rule.get_scores(
+                [targets[i] for i in valid_indices.tolist()]
+            )
+        else:
+            break
+        valid = ~np.isnan(weighted_scores)
+
+    return weighted_scores
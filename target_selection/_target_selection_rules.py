@@ -1,9 +1,10 @@
 import math
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
-from project_otto.frames import LauncherFrame
-from project_otto.spatial import Position
 from project_otto.target_tracker import TrackedTarget
 from project_otto.transform_providers import WorldFrameToLauncherFrameTransformProvider
 
@@ -11,8 +12,14 @@ from project_otto.transform_providers import WorldFrameToLauncherFrameTransformP
 class TargetSelectionRule(ABC):
     """
     Abstract class for target selection rules.
+
+    Attributes:
+        can_invalidate: whether the rule may mark targets as invalid. Rules which never do can
+          skip evaluating targets already invalidated by other rules.
     """
 
+    can_invalidate: bool = True
+
     @abstractmethod
     def get_score(self, target: TrackedTarget) -> Optional[float]:
         """
@@ -28,6 +35,44 @@ class TargetSelectionRule(ABC):
         """
         pass
 
+    def get_scores(self, targets: Sequence[TrackedTarget]) -> npt.NDArray[np.float64]:
+        """
+        Compute the scores of several targets at once.
+
+        Rules which can evaluate many targets more cheaply together should override this, and
+        implement :meth:`get_score` through it, so that the two cannot disagree. The default
+        implementation calls :meth:`get_score` on each target.
+
+        Args:
+            targets: Targets in WorldFrame to evaluate.
+        Returns:
+            An array with the score of each target, in order, with NaN for invalid targets.
+        """
+        return np.array(
+            [_score_or_nan(self.get_score(target)) for target in targets], dtype=np.float64
+        )
+
+
+def _score_or_nan(score: Optional[float]) -> float:
+    return math.nan if score is None else score
+
+
+def _score_or_none(score: float) -> Optional[float]:
+    return None if math.isnan(score) else float(score)
+
+
+def _launcher_relative_positions(
+    transform_provider: WorldFrameToLauncherFrameTransformProvider,
+    targets: Sequence[TrackedTarget],
+) -> npt.NDArray[np.float64]:
+    """Returns the (N, 3) array of the targets' estimated positions in the launcher frame."""
+    transform = transform_provider.world_frame_to_launcher_frame_transform
+    return transform.apply_to_positions_array(
+        np.array(
+            [target.latest_estimated_position.as_tuple() for target in targets], dtype=np.float64
+        ).reshape(-1, 3)
+    )
+
 
 class TurretRotationDifferenceRule(TargetSelectionRule):
     """
@@ -37,6 +82,8 @@ class TurretRotationDifferenceRule(TargetSelectionRule):
         turret_transform_provider: a Transform Provider indicating the position of the turret
     """
 
+    can_invalidate = False
+
     def __init__(self, turret_transform_provider: WorldFrameToLauncherFrameTransformProvider):
         self._turret_transform_provider = turret_transform_provider
 
@@ -55,18 +102,21 @@ class TurretRotationDifferenceRule(TargetSelectionRule):
             A float value that ranges from 0 to 100. The higher the value is, the worse the target
             is.
         """
-        transform = self._turret_transform_provider.world_frame_to_launcher_frame_transform
-        turret_relative_position = transform.apply_to_position(target.latest_estimated_position)
-        distance_from_turret = Position.distance(turret_relative_position, Position(0, 0, 0))
-        distance_along_forward_direction = turret_relative_position.x
+        return _score_or_none(self.get_scores([target])[0])
 
-        if distance_from_turret == 0:
-            return 0
+    def get_scores(self, targets: Sequence[TrackedTarget]) -> npt.NDArray[np.float64]:
+        """
+        Calculate the aiming scores of several targets at once; see :meth:`get_score`.
+        """
+        positions = _launcher_relative_positions(self._turret_transform_provider, targets)
 
-        target_angle_score_from_turret_center = (
-            math.acos(distance_along_forward_direction / distance_from_turret) * 100 / math.pi
-        )
-        return target_angle_score_from_turret_center
+        # acos(x / |p|) == atan2(|(y, z)|, x), which needs no division and stays in range without
+        # clipping. A target at the turret itself is still special-cased, as atan2(0, -0) is pi.
+        forward_distances = positions[:, 0]
+        off_axis_distances = np.hypot(positions[:, 1], positions[:, 2])
+        at_turret = (off_axis_distances == 0) & (forward_distances == 0)
+        angles = np.arctan2(off_axis_distances, forward_distances)
+        return np.where(at_turret, 0.0, angles * 100 / math.pi)
 
 
 class TurretDistanceRule(TargetSelectionRule):
@@ -84,6 +134,7 @@ class TurretDistanceRule(TargetSelectionRule):
         turret_transform_provider: WorldFrameToLauncherFrameTransformProvider,
     ):
         self._max_distance = max_distance
+        self._max_distance_squared = max_distance * max_distance
         self._turret_transform_provider = turret_transform_provider
 
     def get_score(self, target: TrackedTarget) -> Optional[float]:
@@ -102,16 +153,18 @@ class TurretDistanceRule(TargetSelectionRule):
             A float value that ranges from 0 to 100. The higher the value is, the worse the target
             is. None if the target is invalid.
         """
-        transform = self._turret_transform_provider.world_frame_to_launcher_frame_transform
-        turret_relative_position = transform.apply_to_position(target.latest_estimated_position)
-        distance_from_turret = Position.distance(
-            turret_relative_position, Position[LauncherFrame].of_origin()
-        )
-
-        if distance_from_turret > self._max_distance:
-            return None
+        return _score_or_none(self.get_scores([target])[0])
 
-        return (distance_from_turret / self._max_distance) * 100
+    def get_scores(self, targets: Sequence[TrackedTarget]) -> npt.NDArray[np.float64]:
+        """
+        Calculate the distance scores of several targets at once; see :meth:`get_score`.
+        """
+        positions = _launcher_relative_positions(self._turret_transform_provider, targets)
+        squared_distances = np.sum(np.square(positions), axis=1)
+        in_range = squared_distances <= self._max_distance_squared
+        scores = np.full(len(squared_distances), np.nan)
+        scores[in_range] = np.sqrt(squared_distances[in_range]) / self._max_distance * 100
+        return scores
 
 
 class IdentityRule(TargetSelectionRule):
@@ -119,6 +172,8 @@ class IdentityRule(TargetSelectionRule):
     Rule based on the identity of the target.
     """
 
+    can_invalidate = False
+
     def __init__(self, target: Optional[TrackedTarget]):
         self._target = target
 
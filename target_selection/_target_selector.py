@@ -1,7 +1,8 @@
 from typing import Generic, Optional, TypeVar
 
+import numpy as np
+
 from project_otto.beyblade_identification import BeybladeIdentifier
-from project_otto.spatial import Position
 from project_otto.target_tracker import TrackedTarget
 
 from ._target_selector_update_state import TargetSelectorUpdateState
@@ -28,6 +29,7 @@ class TargetSelector(Generic[InTrackedTarget]):
     _last_update_state: TargetSelectorUpdateState[InTrackedTarget]
     _identifier: BeybladeIdentifier[InTrackedTarget]
     _max_radius: float
+    _max_radius_squared: float
 
     def __init__(
         self,
@@ -39,18 +41,25 @@ class TargetSelector(Generic[InTrackedTarget]):
         self._last_update_state = TargetSelectorUpdateState(lambda _: None, lambda _: None, [], [])
         self._identifier = identifier
         self._max_radius = max_radius
+        self._max_radius_squared = max_radius * max_radius
 
     def _reselect_robot(self, update_state: TargetSelectorUpdateState[InTrackedTarget]):
         self._robot_target = update_state.robot_selector(update_state.robots)
 
     def _reselect_plate(self, update_state: TargetSelectorUpdateState[InTrackedTarget]):
         if self._robot_target is not None:
-            robot_position = self._robot_target.latest_estimated_position
+            robot_position = np.array(
+                self._robot_target.latest_estimated_position.as_tuple(), dtype=np.float64
+            )
+            plate_positions = np.array(
+                [plate.latest_estimated_position.as_tuple() for plate in update_state.plates],
+                dtype=np.float64,
+            ).reshape(-1, 3)
+            # Compared squared, as only which plates are within the radius matters
+            squared_distances = np.sum(np.square(plate_positions - robot_position), axis=1)
+            within_radius = squared_distances < self._max_radius_squared
             filtered_plates = [
-                plate
-                for plate in update_state.plates
-                if Position.distance(robot_position, plate.latest_estimated_position)
-                < self._max_radius
+                plate for plate, keep in zip(update_state.plates, within_radius.tolist()) if keep
             ]
             self._plate_target = update_state.plate_selector(filtered_plates)
         else:
@@ -90,7 +99,7 @@ class TargetSelector(Generic[InTrackedTarget]):
         self._identifier.update(update_state.robots, update_state.plates)
         self._last_update_state = update_state
 
-        if self._robot_target is None or self._robot_target not in update_state.robots:
+        if self._robot_target is None or not update_state.has_robot(self._robot_target):
             self._reselect_robot(update_state)
         self._reselect_plate(update_state)
 
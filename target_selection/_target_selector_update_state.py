@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Generic, List, Optional, Sequence, TypeVar
 
 from project_otto.target_tracker import TrackedTarget
 
@@ -24,3 +24,15 @@ class TargetSelectorUpdateState(Generic[InTrackedTarget]):
     plate_selector: Callable[[Sequence[InTrackedTarget]], Optional[InTrackedTarget]]
     robots: List[InTrackedTarget]
     plates: List[InTrackedTarget]
+
+    # Tracked targets compare by identity, so membership in robots can be checked by id in O(1).
+    robot_ids: FrozenSet[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.robot_ids = frozenset(id(robot) for robot in self.robots)
+
+    def has_robot(self, robot: InTrackedTarget) -> bool:
+        """
+        Returns whether the given robot target is one of the observed robot targets.
+        """
+        return id(robot) in self.robot_ids
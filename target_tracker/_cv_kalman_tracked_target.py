@@ -1,5 +1,7 @@
 import logging
-from typing import Tuple
+import weakref
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -12,6 +14,7 @@ from project_otto.target_tracker._tracked_target import TrackedTarget
 from project_otto.timestamps import JetsonTimestamp
 
 Tensor = npt.NDArray[np.float64]
+IndexArray = npt.NDArray[np.int64]
 
 COVARIANCE_WARNING_THRESHOLD = 1e13
 
@@ -22,6 +25,62 @@ def assert_shape_equals(tensor_name: str, shape: Tuple[int, ...], expected_shape
         raise ValueError(f"Expected tensor {tensor_name} of shape {expected_shape}, got {shape}.")
 
 
+@lru_cache(maxsize=None)
+def _taylor_template(n: int, m: int) -> Tuple[IndexArray, IndexArray, IndexArray]:
+    """
+    Returns the (rows, columns, powers) index arrays describing the nonzero Taylor tensor entries.
+
+    Entry ``(rows[i], columns[i])`` of the Taylor tensor holds the ``powers[i]``-th series term.
+    Only depends on the tensor dimensions, so it is computed once per shape.
+    """
+    rows, columns, powers = [], [], []
+    for i in range(n):
+        for j in range(i, n):
+            for k in range(m):
+                rows.append(k + n * i)
+                columns.append(k + n * j)
+                powers.append(j - i)
+
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(columns, dtype=np.int64),
+        np.array(powers, dtype=np.int64),
+    )
+
+
+class _SharedEvolution:
+    """
+    Evolution map and noise for the most recently used dt, shared by targets of one configuration.
+
+    The tensors only depend on the configuration and dt, and a tracker moves all of its targets
+    to the same timestamp each frame, so one target computes them and the rest reuse them.
+    """
+
+    def __init__(self, config: TargetConfiguration):
+        # Held so that the configuration's id cannot be reused while this is cached under it
+        self.config = config
+        self.dt: Optional[float] = None
+        self.tensors: Tuple[Tensor, Tensor] = (np.empty(0), np.empty(0))
+
+
+_shared_evolutions: "weakref.WeakValueDictionary[int, _SharedEvolution]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _shared_evolution_for(config: TargetConfiguration) -> _SharedEvolution:
+    """
+    Returns the evolution cache for the given configuration, creating it if necessary.
+
+    Configurations are mutable and so unhashable; they are matched by identity instead.
+    """
+    shared = _shared_evolutions.get(id(config))
+    if shared is None or shared.config is not config:
+        shared = _SharedEvolution(config)
+        _shared_evolutions[id(config)] = shared
+    return shared
+
+
 def _build_initial_covariance(config: TargetConfiguration) -> Tensor:
     expected_uncertainty_length = config.num_derivatives * config.num_independent_vars
     if len(config.initial_derivative_variance) != expected_uncertainty_length:
@@ -71,10 +130,27 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         self._k = config.num_measured_vars
 
         self._ode_coefficients: Tensor = config.ode_coefficients
+        # Bottom rows of every evolution map: the ODE coefficients, then zeros for the highest
+        # derivative. They don't depend on dt, so they are laid out once.
+        self._evolution_map_tail: Tensor = np.zeros((self._m, self._n * self._m), dtype=np.float64)
+        self._evolution_map_tail[:, : -self._m] = np.reshape(
+            self._ode_coefficients, (self._m, (self._n - 1) * self._m)
+        )
         self._intrinsic_noise: Tensor = np.reshape(config.intrinsic_noise, (self._n * self._m,))
 
         self._k_filter = KalmanFilter(self._n * self._m, self._k, 0, CV_64F)
 
+        # The Taylor tensor's sparsity pattern is fixed for the target's lifetime; only the series
+        # terms change with dt, so they are written into a reused buffer.
+        self._taylor_rows, self._taylor_columns, self._taylor_powers = _taylor_template(
+            self._n, self._m
+        )
+        self._taylor_buffer: Tensor = np.zeros(2 * (self._n * self._m,), dtype=np.float64)
+        self._taylor_divisors: Tensor = np.arange(1, self._n, dtype=np.float64)
+        self._measurement_buffer: Tensor = np.empty((self._k,), dtype=np.float64)
+        self._scaled_taylor_buffer: Tensor = np.empty_like(self._taylor_buffer)
+        self._shared_evolution = _shared_evolution_for(config)
+
         self._k_filter.measurementMatrix = np.reshape(
             config.measurement_map, (self._k, self._n * self._m)
         ).astype(np.float64)
@@ -88,6 +164,11 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
 
         self._k_filter.errorCovPost = _build_initial_covariance(config)
 
+        # Estimates built from the filter state, cached until the next update
+        self._latest_estimated_position: Optional[Position[WorldFrame]] = None
+        self._latest_estimated_velocity: Optional[Vector[WorldFrame]] = None
+        self._latest_uncertainty: Optional[Vector[WorldFrame]] = None
+
         # Update step automatically initializes other covariances according to config params
         self.update_from_new_position_measurement(init_measurement, init_timestamp)
 
@@ -96,14 +177,18 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         """
         The position estimated at the time of the most recent update.
         """
-        return Position(*self._k_filter.statePost[:3])
+        if self._latest_estimated_position is None:
+            self._latest_estimated_position = Position(*self._latest_state()[:3].tolist())
+        return self._latest_estimated_position
 
     @property
     def latest_estimated_velocity(self) -> Vector[WorldFrame]:
         """
         The velocity estimated at the time of the most recent update.
         """
-        return Vector(*self._k_filter.statePost[3:6])
+        if self._latest_estimated_velocity is None:
+            self._latest_estimated_velocity = Vector(*self._latest_state()[3:6].tolist())
+        return self._latest_estimated_velocity
 
     @property
     def latest_update_timestamp(self) -> JetsonTimestamp:
@@ -117,7 +202,9 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         """
         The latest uncertainty matrix.
         """
-        return Vector.from_values(np.diag(self._k_filter.errorCovPost)[:3])
+        if self._latest_uncertainty is None:
+            self._latest_uncertainty = Vector.from_values(np.diag(self._k_filter.errorCovPost)[:3])
+        return self._latest_uncertainty
 
     def extrapolate_position(self, timestamp: JetsonTimestamp) -> Position[WorldFrame]:
         """
@@ -130,21 +217,12 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         """
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
-
-        self._k_filter.transitionMatrix = self._evolution_map(taylor_tensor)
-        self._k_filter.processNoiseCov = self._evolution_noise(taylor_tensor)
-
-        state_pre: Tensor = self._k_filter.statePre.copy()
-        error_cov_pre: Tensor = self._k_filter.errorCovPre.copy()
-        state_post: Tensor = self._k_filter.statePost.copy()
-        error_cov_post: Tensor = self._k_filter.errorCovPost.copy()
-        prediction: Tensor = self._k_filter.predict()
+        # Equivalent to the state KalmanFilter.predict() would produce, computed directly so the
+        # filter's state and covariances don't have to be saved and restored around it.
+        evolution_map, _ = self._evolution(dt)
+        prediction: Tensor = evolution_map[:3] @ self._latest_state()
 
-        self._k_filter.statePre, self._k_filter.errorCovPre = state_pre, error_cov_pre
-        self._k_filter.statePost, self._k_filter.errorCovPost = state_post, error_cov_post
-
-        return Position(*prediction[:3])
+        return Position(*prediction)
 
     def update_from_new_position_measurement(
         self, measurement: MeasuredPosition[WorldFrame], timestamp: JetsonTimestamp
@@ -160,19 +238,17 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
 
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
-
-        self._k_filter.transitionMatrix = self._evolution_map(taylor_tensor)
-        self._k_filter.processNoiseCov = self._evolution_noise(taylor_tensor)
+        self._k_filter.transitionMatrix, self._k_filter.processNoiseCov = self._evolution(dt)
         self._k_filter.measurementNoiseCov = measurement.uncertainty.covariance
 
-        measurement_position_array: Tensor = np.array(
-            list(measurement.position.as_tuple()), dtype=np.float64
-        )
+        # correct() only reads the measurement, so one buffer is reused across updates
+        measurement_position_array = self._measurement_buffer
+        measurement_position_array[:] = measurement.position.as_tuple()
 
         self._t = timestamp
         self._k_filter.predict()
         self._k_filter.correct(measurement_position_array)
+        self._invalidate_latest_estimates()
 
         if np.max(self._k_filter.errorCovPost) > COVARIANCE_WARNING_THRESHOLD:
             logging.warning(
@@ -189,12 +265,10 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         """
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
-
-        self._k_filter.transitionMatrix = self._evolution_map(taylor_tensor)
-        self._k_filter.processNoiseCov = self._evolution_noise(taylor_tensor)
+        self._k_filter.transitionMatrix, self._k_filter.processNoiseCov = self._evolution(dt)
 
         self._k_filter.predict()
+        self._invalidate_latest_estimates()
 
         self._t = timestamp
 
@@ -204,6 +278,38 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
                 + f"{COVARIANCE_WARNING_THRESHOLD:e}"
             )
 
+    def _latest_state(self) -> Tensor:
+        """
+        Returns the filter's latest corrected state as a flat array.
+        """
+        return np.reshape(self._k_filter.statePost, (self._n * self._m,))
+
+    def _invalidate_latest_estimates(self):
+        """
+        Discards the cached estimates after the filter state has changed.
+        """
+        self._latest_estimated_position = None
+        self._latest_estimated_velocity = None
+        self._latest_uncertainty = None
+
+    def _evolution(self, dt: float) -> Tuple[Tensor, Tensor]:
+        """
+        Returns the evolution map and evolution noise over dt.
+
+        Reuses the tensors last computed by any target sharing this target's configuration, if
+        they were computed for the same dt. The returned tensors must not be modified.
+        """
+        shared = self._shared_evolution
+        if dt != shared.dt:
+            taylor_tensor = self._taylor_tensor(dt)
+            shared.tensors = (
+                self._evolution_map(taylor_tensor),
+                self._evolution_noise(taylor_tensor),
+            )
+            shared.dt = dt
+
+        return shared.tensors
+
     def _taylor_tensor(self, dt: float) -> Tensor:
         """
         Generates tensor containing Taylor series coefficients up to m+1 terms.
@@ -214,16 +320,12 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
          [ 0,         0,         1,   dt / 1!, ... ],
          ...                                        ]
         """
-        taylor: Tensor = np.zeros(2 * (self._n * self._m,), dtype=np.float64)
+        # p[i] = dt^i / i!
         p: Tensor = np.ones((self._n,))
+        np.cumprod(dt / self._taylor_divisors, out=p[1:])
 
-        for i in range(1, self._n):
-            p[i] = dt * p[i - 1] / i
-
-        for i in range(self._n):
-            for j in range(i, self._n):
-                for k in range(self._m):
-                    taylor[k + self._n * i, k + self._n * j] = p[j - i]
+        taylor = self._taylor_buffer
+        taylor[self._taylor_rows, self._taylor_columns] = p[self._taylor_powers]
 
         return taylor
 
@@ -232,10 +334,7 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         Uses taylor tensor to calculate evolution map.
         """
         evol_map: Tensor = taylor.copy()
-        evol_map[-self._m :, : -self._m] = np.reshape(
-            self._ode_coefficients, (self._m, (self._n - 1) * self._m)
-        )
-        evol_map[-self._m :, -self._m :] = 0
+        evol_map[-self._m :] = self._evolution_map_tail
 
         return evol_map
 
@@ -243,6 +342,9 @@ class OpenCVKalmanTrackedTarget(TrackedTarget):
         """
         Uses taylor tensor to calculate expected evolution noise.
         """
-        noise: Tensor = np.einsum("ij,j,kj->ik", taylor, self._intrinsic_noise, taylor)
+        # Equivalent to einsum("ij,j,kj->ik", taylor, intrinsic_noise, taylor), but the second
+        # step runs as a BLAS matmul.
+        scaled = np.multiply(taylor, self._intrinsic_noise, out=self._scaled_taylor_buffer)
+        noise: Tensor = np.matmul(scaled, taylor.T)
 
         return noise
@@ -1,5 +1,6 @@
 import logging
-from typing import Tuple
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -12,6 +13,7 @@ from project_otto.target_tracker.estimators import Estimation, KalmanFilter
 from project_otto.timestamps import JetsonTimestamp
 
 Tensor = npt.NDArray[np.float64]
+IndexArray = npt.NDArray[np.int64]
 
 COVARIANCE_WARNING_THRESHOLD = 1e13
 
@@ -22,6 +24,26 @@ def assert_shape_equals(tensor_name: str, shape: Tuple[int, ...], expected_shape
         raise ValueError(f"Expected tensor {tensor_name} of shape {expected_shape}, got {shape}.")
 
 
+@lru_cache(maxsize=None)
+def _taylor_template(
+    state_shape: Tuple[int, ...]
+) -> Tuple[IndexArray, IndexArray, IndexArray, IndexArray]:
+    """
+    Returns the (i, j, k, power) index arrays describing the nonzero Taylor tensor entries.
+
+    Entry ``(i[a], j[a], k[a], j[a])`` of the Taylor tensor holds the ``power[a]``-th series term.
+    Only depends on the state shape, so it is computed once per shape.
+    """
+    num_terms, num_vars = state_shape
+    i, k, j = np.nonzero(
+        np.broadcast_to(
+            np.triu(np.ones((num_terms, num_terms), dtype=np.bool_))[:, :, np.newaxis],
+            (num_terms, num_terms, num_vars),
+        )
+    )
+    return i, j, k, k - i
+
+
 class KalmanTrackedTarget(TrackedTarget):
     """
     Represents the 3D position and velocity of a single target (plate).
@@ -59,6 +81,11 @@ class KalmanTrackedTarget(TrackedTarget):
             config.measurement_map,
         )
 
+        # Evolution tensors for the most recently used dt. A frame usually extrapolates and then
+        # updates every target to the same timestamp, so consecutive calls tend to share a dt.
+        self._evolution_dt: Optional[float] = None
+        self._evolution_tensors: Tuple[Tensor, Tensor] = (np.empty(0), np.empty(0))
+
         expected_uncertainty_length = config.num_derivatives * config.num_independent_vars
         if len(config.initial_derivative_variance) != expected_uncertainty_length:
             raise ValueError(
@@ -127,13 +154,11 @@ class KalmanTrackedTarget(TrackedTarget):
         """
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
+        evol_map, evol_noise = self._evolution(dt)
 
         prior = Estimation(self._x, self._s)
 
-        prediction = self._k_filter.predict(
-            prior, self._evolution_map(taylor_tensor), self._evolution_noise(taylor_tensor)
-        )
+        prediction = self._k_filter.predict(prior, evol_map, evol_noise)
 
         return Position(*prediction.expectation[0, :])
 
@@ -151,15 +176,15 @@ class KalmanTrackedTarget(TrackedTarget):
 
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
+        evol_map, evol_noise = self._evolution(dt)
 
         prior = Estimation(self._x, self._s)
-        position_tensor: Tensor = np.array(measurement.position.as_tuple())
+        position_tensor: Tensor = measurement.position.as_array()
 
         new_estimate = self._k_filter.update(
             prior,
-            self._evolution_map(taylor_tensor),
-            self._evolution_noise(taylor_tensor),
+            evol_map,
+            evol_noise,
             position_tensor,
             measurement.uncertainty.covariance,
         )
@@ -183,13 +208,11 @@ class KalmanTrackedTarget(TrackedTarget):
         """
         dt = (timestamp - self._t).duration_seconds
 
-        taylor_tensor = self._taylor_tensor(dt)
+        evol_map, evol_noise = self._evolution(dt)
 
         prior = Estimation(self._x, self._s)
 
-        prediction = self._k_filter.predict(
-            prior, self._evolution_map(taylor_tensor), self._evolution_noise(taylor_tensor)
-        )
+        prediction = self._k_filter.predict(prior, evol_map, evol_noise)
 
         self._t = timestamp
         self._x = prediction.expectation
@@ -200,6 +223,22 @@ class KalmanTrackedTarget(TrackedTarget):
                 + f"{COVARIANCE_WARNING_THRESHOLD:e}"
             )
 
+    def _evolution(self, dt: float) -> Tuple[Tensor, Tensor]:
+        """
+        Returns the evolution map and evolution noise over dt, reusing them if dt is unchanged.
+
+        The returned tensors are shared between calls and must not be modified.
+        """
+        if dt != self._evolution_dt:
+            taylor_tensor = self._taylor_tensor(dt)
+            self._evolution_tensors = (
+                self._evolution_map(taylor_tensor),
+                self._evolution_noise(taylor_tensor),
+            )
+            self._evolution_dt = dt
+
+        return self._evolution_tensors
+
     def _taylor_tensor(self, dt: float) -> Tensor:
         """
         Generates tensor containing Taylor series coefficients up to m+1 terms.
@@ -211,15 +250,13 @@ class KalmanTrackedTarget(TrackedTarget):
          ...                                        ]
         """
         taylor: Tensor = np.zeros(2 * self._k_filter.state_shape)
-        p: Tensor = np.ones((taylor.shape[0],))
 
-        for i in range(1, taylor.shape[0]):
-            p[i] = dt * p[i - 1] / i
+        # p[i] = dt^i / i!
+        p: Tensor = np.ones((taylor.shape[0],))
+        np.cumprod(dt / np.arange(1, taylor.shape[0]), out=p[1:])
 
-        for i in range(taylor.shape[0]):
-            for k in range(i, taylor.shape[0]):
-                for j in range(taylor.shape[1]):
-                    taylor[i, j, k, j] = p[k - i]
+        i, j, k, powers = _taylor_template(self._k_filter.state_shape)
+        taylor[i, j, k, j] = p[powers]
 
         return taylor
 
@@ -246,11 +283,6 @@ def var_to_covar(var: Tensor):
     """
     Helper function converts a variance tensor into a covariance matrix assuming no correlation.
     """
-    return np.einsum(
-        "ij,ik,jl,im,jn->klmn",
-        var,
-        np.eye(var.shape[0]),
-        np.eye(var.shape[1]),
-        np.eye(var.shape[0]),
-        np.eye(var.shape[1]),
-    )
+    # covar[i, j, i, j] = var[i, j], which is the diagonal of covar flattened to a matrix
+    covar: Tensor = np.diag(np.ravel(var).astype(np.float64)).reshape(2 * var.shape)
+    return covar
@@ -1,8 +1,10 @@
-from typing import Callable, Generic, List, Optional, TypeVar
+from typing import Callable, Generic, List, TypeVar
+
+import numpy as np
 
 from project_otto.frames import WorldFrame
-from project_otto.spatial import MeasuredPosition, Position
-from project_otto.target_detector import DetectedTargetPosition, WorldDetectedTargetSet
+from project_otto.spatial import MeasuredPosition
+from project_otto.target_detector import WorldDetectedTargetSet
 from project_otto.target_tracker._config import TargetConfiguration, TrackerConfiguration
 from project_otto.target_tracker._tracked_target import TrackedTarget
 from project_otto.timestamps import JetsonTimestamp
@@ -58,39 +60,60 @@ class TargetTracker(Generic[InTrackedTarget]):
         """
         new_targets: List[InTrackedTarget] = []
         measured_targets_list = list(measured_targets.positions)
+        timestamp = measured_targets.jetson_timestamp
+
+        # Squared distance from each target's extrapolated position to each measurement
+        extrapolated_positions = np.array(
+            [target.extrapolate_position(timestamp).as_tuple() for target in self._targets],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        measured_positions = np.array(
+            [
+                measured_target.measurement.position.as_tuple()
+                for measured_target in measured_targets_list
+            ],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        squared_distances = np.sum(
+            np.square(extrapolated_positions[:, np.newaxis, :] - measured_positions), axis=2
+        )
+
+        # Greedy search for the nearest remaining measurement to each target, in target order.
+        # Measurements no nearer than max_distance, or already taken by an earlier target, are
+        # excluded by setting their distance to infinity.
+        max_squared_distance = self._config.max_distance * self._config.max_distance
+        np.putmask(squared_distances, squared_distances >= max_squared_distance, np.inf)
+        unmatched = np.ones(len(measured_targets_list), dtype=np.bool_)
+
+        for target, target_squared_distances in zip(self._targets, squared_distances):
+            nearest_index = (
+                int(np.argmin(target_squared_distances)) if len(measured_targets_list) > 0 else None
+            )
 
-        # Naive search for nearest measurement to each target
-        for target in self._targets:
-            extrapolated_position = target.extrapolate_position(measured_targets.jetson_timestamp)
-            nearest_measurement: Optional[DetectedTargetPosition[WorldFrame]] = None
-            nearest_distance = self._config.max_distance
-            for measured_target in measured_targets_list:
-                distance = Position.distance(
-                    extrapolated_position, measured_target.measurement.position
-                )
-                if distance < nearest_distance:
-                    nearest_measurement = measured_target
-                    nearest_distance = distance
-
-            if nearest_measurement is not None:
+            if nearest_index is not None and np.isfinite(target_squared_distances[nearest_index]):
                 target.update_from_new_position_measurement(
-                    nearest_measurement.measurement, measured_targets.jetson_timestamp
+                    measured_targets_list[nearest_index].measurement, timestamp
                 )
                 new_targets.append(target)
-                measured_targets_list.remove(nearest_measurement)
+                unmatched[nearest_index] = False
+                squared_distances[:, nearest_index] = np.inf
 
-            elif (
-                measured_targets.jetson_timestamp - target.latest_observed_timestamp
-            ) <= self._config.max_staleness:
-                target.update_from_extrapolation(measured_targets.jetson_timestamp)
+            elif (timestamp - target.latest_observed_timestamp) <= self._config.max_staleness:
+                target.update_from_extrapolation(timestamp)
                 new_targets.append(target)
 
+        measured_targets_list = [
+            measured_target
+            for measured_target, keep in zip(measured_targets_list, unmatched.tolist())
+            if keep
+        ]
+
         for measured_target in measured_targets_list:
             new_targets.append(
                 self._target_type(
                     self._target_config,
                     measured_target.measurement,
-                    measured_targets.jetson_timestamp,
+                    timestamp,
                     self._next_instance_id,
                 )
             )
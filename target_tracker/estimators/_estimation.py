@@ -28,13 +28,17 @@ class Estimation:
     def __post_init__(self):
         """
         Validates state-covariance pair.
+
+        The covariance's eigenvalue and symmetry checks cost more than the filter steps producing
+        it, so like assertions they only run when Python isn't optimizing (i.e. without ``-O``).
         """
         if self.covariance.shape != 2 * self.expectation.shape:
             raise ValueError(
                 f"Expected covariance of shape {2 * self.expectation.shape}, got "
                 + f"{self.covariance.shape}."
             )
-        assert_valid_covariance("covariance", self.covariance)
+        if __debug__:
+            assert_valid_covariance("covariance", self.covariance)
 
     def as_tuple(self):
         """
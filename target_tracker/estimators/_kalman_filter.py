@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Callable, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -18,6 +18,45 @@ def assert_shape_equals(tensor_name: str, shape: Tuple[int, ...], expected_shape
         raise ValueError(f"Expected tensor {tensor_name} of shape {expected_shape}, got {shape}.")
 
 
+def _symmetrized(covariance: Tensor) -> Tensor:
+    """
+    Removes the asymmetry floating point errors introduce into a flattened covariance.
+    """
+    symmetric_covariance: Tensor = 0.5 * (covariance + np.transpose(covariance))
+    return symmetric_covariance
+
+
+def _inverse_symmetric(matrix: Tensor) -> Tensor:
+    """
+    Inverts a symmetric matrix.
+
+    3x3 matrices, i.e. covariances of position measurements, are inverted in closed form from
+    their cofactors; at that size LAPACK's call overhead far exceeds the arithmetic.
+    """
+    if matrix.shape != (3, 3):
+        inverse: Tensor = np.linalg.inv(matrix)
+        return inverse
+
+    (a, b, c), (_, d, e), (_, _, f) = matrix.tolist()
+
+    # Cofactors, which are symmetric like the matrix itself
+    c00 = d * f - e * e
+    c01 = c * e - b * f
+    c02 = b * e - c * d
+    c11 = a * f - c * c
+    c12 = b * c - a * e
+    c22 = a * d - b * b
+
+    determinant = a * c00 + b * c01 + c * c02
+    if determinant == 0:
+        raise np.linalg.LinAlgError("Singular matrix")
+
+    adjugate: Tensor = np.array(
+        [[c00, c01, c02], [c01, c11, c12], [c02, c12, c22]], dtype=np.float64
+    )
+    return adjugate / determinant
+
+
 class KalmanFilter:
     """
     Kalman filter that admits variable evolution and evolution noise.
@@ -26,6 +65,9 @@ class KalmanFilter:
         state_shape: Shape of state tensor.
         measurement_shape: Shape of measurement tensor.
         measurement_map: Tensor of shape n+k giving the mapping from the state to the measurement.
+        robust_covariance: Whether to correct covariances against floating point errors with
+            :func:`nearest_valid_covariance`, rather than only re-symmetrizing them. Slower, meant
+            for offline analysis.
     """
 
     def __init__(
@@ -33,6 +75,7 @@ class KalmanFilter:
         state_shape: Tuple[int, ...],
         measurement_shape: Tuple[int, ...],
         measurement_map: Tensor,
+        robust_covariance: bool = False,
     ):
 
         # Shape of variables
@@ -45,6 +88,10 @@ class KalmanFilter:
         assert_shape_equals("measurement_shape", measurement_map.shape, self._k + self._n)
         self._measurement_map = measurement_map
 
+        self._correct_covariance: Callable[[Tensor], Tensor] = (
+            nearest_valid_covariance if robust_covariance else _symmetrized
+        )
+
     @property
     def state_shape(self) -> Tuple[int, ...]:
         """
@@ -70,29 +117,12 @@ class KalmanFilter:
         Returns:
             State and covariance tensors.
         """
-        assert_shape_equals("prior.state", prior.expectation.shape, self._n)
-        # Covariance implicitly checked by above line
-        assert_shape_equals("evol_transform", evol_map.shape, 2 * self._n)
         assert_shape_equals("evol_noise", evol_noise.shape, 2 * self._n)
 
-        # Flatten to allow for einsum over arbitrary tensor shapes
-        estimation_f: Tensor = np.reshape(prior.expectation, (np.prod(self._n),))
-        covariance_f: Tensor = np.reshape(prior.covariance, 2 * (np.prod(self._n),))
-        transform_f: Tensor = np.reshape(evol_map, 2 * (np.prod(self._n),))
+        x, s = self._evolve(prior, evol_map)
+        s = np.reshape(self._correct_covariance(s), 2 * self._n) + evol_noise
 
-        # Apply differential equation to X and C
-        x: Tensor = np.reshape(np.einsum("ij,j->i", transform_f, estimation_f), self._n)
-        s: Tensor = (
-            np.reshape(
-                nearest_valid_covariance(
-                    np.einsum("ij,jk,lk->il", transform_f, covariance_f, transform_f)
-                ),
-                2 * self._n,
-            )
-            + evol_noise
-        )
-
-        return Estimation(x, s)
+        return Estimation(np.reshape(x, self._n), s)
 
     def filter(
         self, prediction: Estimation, measurement: Tensor, measurement_covariance: Tensor
@@ -105,31 +135,17 @@ class KalmanFilter:
             measurement: The new measurement.
         """
         assert_shape_equals("prediction.state", prediction.expectation.shape, self._n)
-        assert_shape_equals("measurement", measurement.shape, self._k)
-        assert_shape_equals("measurement_covariance", measurement_covariance.shape, 2 * self._k)
-        assert_valid_covariance("measurement_covariance", measurement_covariance)
 
         # Flatten to allow for einsum over arbitrary tensor shapes
-        h: Tensor = np.reshape(self._measurement_map, (np.prod(self._k), np.prod(self._n)))
-        r: Tensor = np.reshape(measurement_covariance, 2 * (np.prod(self._k),))
         x: Tensor = np.reshape(prediction.expectation, (np.prod(self._n),))
         s: Tensor = np.reshape(prediction.covariance, 2 * (np.prod(self._n),))
 
-        # Get measurement residual and its covariance (pre-fit)
-        y: Tensor = measurement - np.einsum("ij,j->i", h, x)
-        d: Tensor = np.einsum("ij,jk,lk->il", h, s, h) + r
+        x, s = self._fit(x, s, measurement, measurement_covariance)
 
-        # Calculate optimal Kalman gain
-        k: Tensor = np.einsum("ij,kj,kl->il", s, h, np.linalg.inv(d))
-
-        # Fit prediction to observation
-        x: Tensor = np.reshape(x + np.einsum("ij,j->i", k, y), self._n)
-        s: Tensor = np.reshape(
-            nearest_valid_covariance(s - np.einsum("ij,jk,kl->il", k, h, s)), 2 * self._n
+        return Estimation(
+            np.reshape(x, self._n), np.reshape(self._correct_covariance(s), 2 * self._n)
         )
 
-        return Estimation(x, s)
-
     def update(
         self,
         prior: Estimation,
@@ -142,7 +158,71 @@ class KalmanFilter:
         Full update step.
 
         Makes a prediction and then filters it. Returns result.
+
+        Equivalent to filtering the result of :meth:`predict`, but the intermediate prediction
+        is neither corrected against floating point errors nor validated; only the result is.
         """
-        return self.filter(
-            self.predict(prior, evol_tensor, evol_noise), measurement, measurement_covariance
+        assert_shape_equals("evol_noise", evol_noise.shape, 2 * self._n)
+
+        x, s = self._evolve(prior, evol_tensor)
+        s = s + np.reshape(evol_noise, s.shape)
+
+        x, s = self._fit(x, s, measurement, measurement_covariance)
+
+        return Estimation(
+            np.reshape(x, self._n), np.reshape(self._correct_covariance(s), 2 * self._n)
         )
+
+    def _evolve(self, prior: Estimation, evol_map: Tensor) -> Tuple[Tensor, Tensor]:
+        """
+        Applies the evolution map to the prior, without adding evolution noise.
+
+        Returns the flattened state and covariance.
+        """
+        assert_shape_equals("prior.state", prior.expectation.shape, self._n)
+        # Covariance implicitly checked by above line
+        assert_shape_equals("evol_transform", evol_map.shape, 2 * self._n)
+
+        # Flatten to allow for einsum over arbitrary tensor shapes
+        estimation_f: Tensor = np.reshape(prior.expectation, (np.prod(self._n),))
+        covariance_f: Tensor = np.reshape(prior.covariance, 2 * (np.prod(self._n),))
+        transform_f: Tensor = np.reshape(evol_map, 2 * (np.prod(self._n),))
+
+        # Apply differential equation to X and C
+        x: Tensor = np.einsum("ij,j->i", transform_f, estimation_f)
+        s: Tensor = np.einsum("ij,jk,lk->il", transform_f, covariance_f, transform_f)
+
+        return x, s
+
+    def _fit(
+        self, x: Tensor, s: Tensor, measurement: Tensor, measurement_covariance: Tensor
+    ) -> Tuple[Tensor, Tensor]:
+        """
+        Fits a flattened prediction to a measurement.
+
+        Returns the flattened state and covariance, the latter not yet corrected against floating
+        point errors.
+        """
+        assert_shape_equals("measurement", measurement.shape, self._k)
+        assert_shape_equals("measurement_covariance", measurement_covariance.shape, 2 * self._k)
+        # Like Estimation's own check, skipped when Python is optimizing (i.e. with ``-O``)
+        if __debug__:
+            assert_valid_covariance("measurement_covariance", measurement_covariance)
+
+        h: Tensor = np.reshape(self._measurement_map, (np.prod(self._k), np.prod(self._n)))
+        r: Tensor = np.reshape(measurement_covariance, 2 * (np.prod(self._k),))
+
+        # Get measurement residual and its covariance (pre-fit)
+        y: Tensor = measurement - np.einsum("ij,j->i", h, x)
+        d: Tensor = np.einsum("ij,jk,lk->il", h, s, h) + r
+
+        # Calculate optimal Kalman gain
+        k: Tensor = np.einsum("ij,kj,kl->il", s, h, _inverse_symmetric(d))
+
+        # Fit prediction to observation. The covariance uses the Joseph form, which stays
+        # symmetric positive semi-definite under rounding, unlike s - khs.
+        x = x + np.einsum("ij,j->i", k, y)
+        a: Tensor = np.eye(s.shape[0]) - np.einsum("ij,jk->ik", k, h)
+        s = np.einsum("ij,jk,lk->il", a, s, a) + np.einsum("ij,jk,lk->il", k, r, k)
+
+        return x, s
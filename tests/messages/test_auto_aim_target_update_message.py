@@ -0,0 +1,28 @@
+"""Copy and pickle round trips for AutoAimTargetUpdateMessage."""
+import copy
+import pickle
+from typing import Any, Callable
+
+import pytest
+
+from project_otto.messages import AutoAimTargetUpdateMessage
+from project_otto.spatial import Position, Vector
+from project_otto.timestamps import OdometryTimestamp
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+)
+def test_auto_aim_target_update_message_round_trip(round_trip: Callable[[Any], Any]):
+    message = AutoAimTargetUpdateMessage.with_target(
+        Position(1.0, 2.0, 3.0),
+        Vector(4.0, 5.0, 6.0),
+        Vector(7.0, 8.0, 9.0),
+        OdometryTimestamp(1234),
+    )
+
+    restored = round_trip(message)
+
+    assert restored == message
+    assert restored.serialize() == message.serialize()
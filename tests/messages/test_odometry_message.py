@@ -0,0 +1,51 @@
+"""Parsing and comparison of OdometryMessage."""
+import struct
+
+import numpy as np
+
+from project_otto.messages import OdometryMessage
+
+_HEADER = struct.Struct("<L6fB")
+_TURRET = struct.Struct("<Lff")
+
+
+def _packet(turrets):
+    data = _HEADER.pack(5, 1.0, 2.0, 3.0, 0.25, 0.5, 0.75, len(turrets))
+    return data + b"".join(_TURRET.pack(*turret) for turret in turrets)
+
+
+def test_odometry_message_parses_turrets():
+    message = OdometryMessage.parse(_packet([(7, 1.5, 2.5), (8, 3.5, 4.5)]))
+
+    assert message.time == 5
+    assert (message.x_pos, message.y_pos, message.z_pos) == (1.0, 2.0, 3.0)
+    assert len(message.turrets) == 2
+    assert int(message.turrets[1]["time"]) == 8
+    assert float(message.turrets[1]["pitch"]) == 3.5
+    assert float(message.turrets[1]["yaw"]) == 4.5
+
+
+def test_odometry_message_turrets_do_not_reference_packet():
+    message = OdometryMessage.parse(_packet([(7, 1.5, 2.5)]))
+
+    assert message.turrets.base is None
+    assert message.turrets.flags.writeable
+
+
+def test_odometry_message_equality():
+    packet = _packet([(7, 1.5, 2.5), (8, 3.5, 4.5)])
+    message = OdometryMessage.parse(packet)
+
+    assert message == OdometryMessage.parse(packet)
+    assert not message != OdometryMessage.parse(packet)
+    assert message != OdometryMessage.parse(_packet([(7, 1.5, 2.5), (8, 3.5, 9.0)]))
+    assert message != OdometryMessage.parse(_packet([(7, 1.5, 2.5)]))
+    assert message != object()
+
+
+def test_odometry_message_without_turrets():
+    message = OdometryMessage.parse(_packet([]))
+
+    assert len(message.turrets) == 0
+    assert message == OdometryMessage.parse(_packet([]))
+    assert np.array_equal(message.turrets, np.empty(0, dtype=message.turrets.dtype))
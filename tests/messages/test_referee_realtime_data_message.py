@@ -0,0 +1,50 @@
+"""Bit field decoding of RefereeRealtimeDataMessage."""
+import struct
+from typing import Tuple
+
+import pytest
+
+from project_otto.messages import RefereeRealtimeDataMessage
+
+_PACKET = struct.Struct("<BHQB")
+
+
+def _expected_power(power_byte: int) -> Tuple[bool, bool, bool]:
+    # Matches the former bitstruct ">p5b1b1b1" decoding: bits 0, 1 and 2 read from the right
+    bits = format(power_byte, "08b")
+    return bits[7] == "1", bits[6] == "1", bits[5] == "1"
+
+
+@pytest.mark.parametrize("power_byte", range(256))
+def test_referee_realtime_data_message_power_bits(power_byte: int):
+    message = RefereeRealtimeDataMessage.parse(_PACKET.pack(0, 0, 0, power_byte))
+
+    assert (
+        message.power_gimbal,
+        message.power_chassis,
+        message.power_shooter,
+    ) == _expected_power(power_byte)
+    assert all(
+        isinstance(flag, bool)
+        for flag in (message.power_gimbal, message.power_chassis, message.power_shooter)
+    )
+
+
+@pytest.mark.parametrize("competition_byte", [0x00, 0x01, 0x10, 0x4F, 0xF4, 0xFF])
+def test_referee_realtime_data_message_competition_nibbles(competition_byte: int):
+    message = RefereeRealtimeDataMessage.parse(_PACKET.pack(competition_byte, 0, 0, 0))
+
+    # Former bitstruct ">u4u4" decoding: stage in the high nibble, type in the low nibble
+    assert message.competition_type == competition_byte & 0x0F
+    assert message.competition_stage == competition_byte >> 4
+
+
+def test_referee_realtime_data_message_fields():
+    message = RefereeRealtimeDataMessage.parse(_PACKET.pack(0x31, 420, 1_600_000_000, 0b101))
+
+    assert message == RefereeRealtimeDataMessage(1, 3, 420, 1_600_000_000, True, False, True)
+
+
+def test_referee_realtime_data_message_rejects_wrong_length():
+    with pytest.raises(ValueError):
+        RefereeRealtimeDataMessage.parse(_PACKET.pack(0, 0, 0, 0)[:-1])
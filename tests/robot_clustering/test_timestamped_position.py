@@ -0,0 +1,23 @@
+"""Copy and pickle round trips for TimestampedPosition."""
+import copy
+import pickle
+from typing import Any, Callable
+
+import pytest
+
+from project_otto.robot_clustering import TimestampedPosition
+from project_otto.spatial import Position
+from project_otto.timestamps import JetsonTimestamp
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+)
+def test_timestamped_position_round_trip(round_trip: Callable[[Any], Any]):
+    timestamped_position = TimestampedPosition(JetsonTimestamp(1.5), Position(1.0, 2.0, 3.0))
+
+    restored = round_trip(timestamped_position)
+
+    assert restored == timestamped_position
+    assert hash(restored) == hash(timestamped_position)
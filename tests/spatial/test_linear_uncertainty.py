@@ -0,0 +1,34 @@
+"""Hashing of LinearUncertainty."""
+import numpy as np
+
+from project_otto.spatial import LinearUncertainty
+
+
+def _hash_of(covariance) -> int:
+    return hash(LinearUncertainty(covariance))
+
+
+def test_linear_uncertainty_hash_ignores_sign_of_zero():
+    positive = np.diag([1.0, 2.0, 3.0])
+    negative = positive.copy()
+    negative[0, 1] = -0.0
+
+    assert _hash_of(positive) == _hash_of(negative)
+
+
+def test_linear_uncertainty_hash_ignores_dtype():
+    covariance = np.diag([1.0, 2.0, 3.0])
+
+    assert _hash_of(covariance) == _hash_of(covariance.astype(np.float32))
+    assert _hash_of(covariance) == _hash_of(np.diag([1, 2, 3]))
+
+
+def test_linear_uncertainty_hash_ignores_memory_layout():
+    covariance = np.arange(9, dtype=np.float64).reshape(3, 3)
+
+    assert _hash_of(covariance.T) == _hash_of(np.ascontiguousarray(covariance.T))
+    assert _hash_of(covariance) == _hash_of(np.asfortranarray(covariance))
+
+
+def test_linear_uncertainty_hash_matches_from_variances():
+    assert _hash_of(np.diag([1.0, 2.0, 3.0])) == hash(LinearUncertainty.from_variances(1, 2, 3))
@@ -0,0 +1,53 @@
+"""Copy and pickle round trips for the slotted, frozen spatial types."""
+import copy
+import pickle
+from typing import Any, Callable, List
+
+import numpy as np
+import pytest
+
+from project_otto.spatial import Orientation, Position
+
+_ROUND_TRIPS: List[Callable[[Any], Any]] = [
+    copy.copy,
+    copy.deepcopy,
+    lambda value: pickle.loads(pickle.dumps(value)),
+]
+
+
+@pytest.mark.parametrize("round_trip", _ROUND_TRIPS)
+def test_orientation_round_trip(round_trip: Callable[[Any], Any]):
+    orientation = Orientation(1.0, 2.0, 3.0, 4.0)
+    # Populate the matrix cache, which the round trip leaves out and rebuilds on first use
+    orientation.as_matrix()
+
+    restored = round_trip(orientation)
+
+    assert restored == orientation
+    assert hash(restored) == hash(orientation)
+    assert restored.as_tuple() == orientation.as_tuple()
+    np.testing.assert_array_equal(restored.as_matrix(), orientation.as_matrix())
+
+
+@pytest.mark.parametrize("round_trip", _ROUND_TRIPS)
+def test_orientation_round_trip_without_cached_matrix(round_trip: Callable[[Any], Any]):
+    orientation = Orientation.of_identity()
+
+    restored = round_trip(orientation)
+
+    assert restored == orientation
+    np.testing.assert_array_equal(restored.as_matrix(), np.eye(3))
+
+
+@pytest.mark.parametrize("round_trip", _ROUND_TRIPS)
+def test_position_round_trip(round_trip: Callable[[Any], Any]):
+    position = Position(1.0, -2.0, 3.5)
+    # Populate the array cache, which the round trip leaves out and rebuilds on first use
+    position.as_array()
+
+    restored = round_trip(position)
+
+    assert restored == position
+    assert hash(restored) == hash(position)
+    np.testing.assert_array_equal(restored.as_array(), [1.0, -2.0, 3.5])
+    assert not restored.as_array().flags.writeable
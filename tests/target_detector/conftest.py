@@ -0,0 +1,45 @@
+"""Plate factories shared by the target detector tests."""
+import random
+from typing import Callable, List
+
+import pytest
+
+from project_otto.geometry import IntRectangle
+from project_otto.robomaster import TeamColor
+from project_otto.target_detector import DetectedTargetRegion
+
+def _plate(
+    confidence: float, x0: int, y0: int, x1: int, y1: int, color: TeamColor = TeamColor.RED
+) -> DetectedTargetRegion:
+    return DetectedTargetRegion(confidence, color, IntRectangle(x0, y0, x1, y1))
+
+
+def _random_plates(seed: int, count: int) -> List[DetectedTargetRegion]:
+    rng = random.Random(seed)
+    plates = []
+    for _ in range(count):
+        x0, y0 = rng.randrange(0, 60), rng.randrange(0, 60)
+        plates.append(
+            _plate(
+                # Few distinct confidences, so that ties are common
+                rng.choice([0.25, 0.5, 0.75, 0.9]),
+                x0,
+                y0,
+                x0 + rng.randrange(1, 30),
+                y0 + rng.randrange(1, 30),
+                rng.choice([TeamColor.RED, TeamColor.BLUE]),
+            )
+        )
+    return plates
+
+
+@pytest.fixture
+def make_plate() -> Callable[..., DetectedTargetRegion]:
+    """Builds a plate from its confidence, rectangle corners and, optionally, color."""
+    return _plate
+
+
+@pytest.fixture
+def random_plates() -> Callable[[int, int], List[DetectedTargetRegion]]:
+    """Builds a reproducible list of plates, of varied colors and sizes, from a seed and count."""
+    return _random_plates
@@ -0,0 +1,60 @@
+"""Pruning of detected target sets, against the former per-plate loop."""
+from typing import Callable, List, Set
+
+import pytest
+
+from project_otto.robomaster import TeamColor
+from project_otto.target_detector import (
+    DetectedTargetRegion,
+    ImageDetectedTargetSet,
+    TargetPruneConfiguration,
+    prune_invalid_targets,
+)
+
+PlateFactory = Callable[..., DetectedTargetRegion]
+RandomPlatesFactory = Callable[[int, int], List[DetectedTargetRegion]]
+
+_CONFIG = TargetPruneConfiguration(minimum_width=10, minimum_height=8)
+
+
+def _reference_pruned(
+    color: TeamColor, plates: Set[DetectedTargetRegion], config: TargetPruneConfiguration
+) -> Set[DetectedTargetRegion]:
+    # The loop prune_invalid_targets replaced
+    return {
+        plate
+        for plate in plates
+        if plate.color != color
+        and plate.rectangle.width >= config.minimum_width
+        and plate.rectangle.height >= config.minimum_height
+    }
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("color", [TeamColor.RED, TeamColor.BLUE])
+def test_prune_invalid_targets_matches_reference(
+    seed: int, color: TeamColor, random_plates: RandomPlatesFactory
+):
+    plates = set(random_plates(seed, 12))
+
+    kept, rejected = prune_invalid_targets(color, ImageDetectedTargetSet(plates), _CONFIG)
+
+    assert kept.plates == _reference_pruned(color, plates, _CONFIG)
+    assert rejected.plates == plates - kept.plates
+
+
+@pytest.mark.parametrize("color", [TeamColor.RED, TeamColor.BLUE])
+def test_prune_invalid_targets_empty(color: TeamColor):
+    kept, rejected = prune_invalid_targets(color, ImageDetectedTargetSet(set()), _CONFIG)
+
+    assert kept.plates == set()
+    assert rejected.plates == set()
+
+
+def test_prune_invalid_targets_single_color(make_plate: PlateFactory):
+    own = {make_plate(0.5, 0, 0, 20, 20), make_plate(0.5, 30, 30, 50, 50)}
+
+    kept, rejected = prune_invalid_targets(TeamColor.RED, ImageDetectedTargetSet(own), _CONFIG)
+
+    assert kept.plates == set()
+    assert rejected.plates == own
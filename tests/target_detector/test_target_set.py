@@ -0,0 +1,75 @@
+"""Non-max suppression of detected target sets, against the former pairwise loop."""
+from typing import Callable, List, Set
+
+import pytest
+
+from project_otto.geometry import IntRectangle
+from project_otto.target_detector import DetectedTargetRegion, ImageDetectedTargetSet
+
+PlateFactory = Callable[..., DetectedTargetRegion]
+RandomPlatesFactory = Callable[[int, int], List[DetectedTargetRegion]]
+
+
+def _reference_non_max_suppressed(
+    plates: Set[DetectedTargetRegion], iou_threshold: float
+) -> Set[DetectedTargetRegion]:
+    # The pairwise loop non_max_suppressed replaced
+    suppressed = set(plates)
+    for plate in plates:
+        for other in plates:
+            if (
+                plate is not other
+                and IntRectangle.iou(plate.rectangle, other.rectangle) >= iou_threshold
+            ):
+                suppressed.discard(min(plate, other, key=lambda x: x.detection_confidence))
+    return suppressed
+
+
+def test_non_max_suppressed_keeps_more_confident_plate(make_plate: PlateFactory):
+    weak = make_plate(0.5, 0, 0, 10, 10)
+    strong = make_plate(0.9, 1, 1, 11, 11)
+    separate = make_plate(0.1, 50, 50, 60, 60)
+
+    result = ImageDetectedTargetSet({weak, strong, separate}).non_max_suppressed(0.5)
+
+    assert result.plates == {strong, separate}
+
+
+def test_non_max_suppressed_equal_confidences_discard_both(make_plate: PlateFactory):
+    first = make_plate(0.5, 0, 0, 10, 10)
+    second = make_plate(0.5, 1, 1, 11, 11)
+
+    result = ImageDetectedTargetSet({first, second}).non_max_suppressed(0.5)
+
+    assert result.plates == set()
+
+
+def test_non_max_suppressed_threshold_is_inclusive(make_plate: PlateFactory):
+    first = make_plate(0.5, 0, 0, 10, 10)
+    # IoU of exactly 0.5 with the first plate
+    second = make_plate(0.9, 0, 0, 10, 20)
+
+    assert ImageDetectedTargetSet({first, second}).non_max_suppressed(0.5).plates == {second}
+    assert ImageDetectedTargetSet({first, second}).non_max_suppressed(0.51).plates == {
+        first,
+        second,
+    }
+
+
+@pytest.mark.parametrize("count", [0, 1])
+def test_non_max_suppressed_small_sets(count: int, make_plate: PlateFactory):
+    plates = {make_plate(0.5, 0, 0, 10, 10) for _ in range(count)}
+
+    assert ImageDetectedTargetSet(plates).non_max_suppressed(0.5).plates == plates
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("iou_threshold", [0.1, 0.5])
+def test_non_max_suppressed_matches_reference(
+    seed: int, iou_threshold: float, random_plates: RandomPlatesFactory
+):
+    plates = set(random_plates(seed, 12))
+
+    result = ImageDetectedTargetSet(plates).non_max_suppressed(iou_threshold)
+
+    assert result.plates == _reference_non_max_suppressed(plates, iou_threshold)
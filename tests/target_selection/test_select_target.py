@@ -0,0 +1,199 @@
+"""Batched target selection, against the former per-target loop."""
+import math
+import random
+from typing import List, Optional, Sequence, Tuple
+
+import pytest
+
+from project_otto.frames import LauncherFrame, WorldFrame
+from project_otto.spatial import MeasuredPosition, Orientation, Position, Transform
+from project_otto.target_selection import (
+    TargetSelectionRule,
+    TargetSelectorConfiguration,
+    TurretDistanceRule,
+    TurretRotationDifferenceRule,
+    select_target,
+)
+from project_otto.target_tracker import TrackedTarget
+from project_otto.timestamps import JetsonTimestamp
+
+_MAX_DISTANCE = 8.0
+
+
+class _StaticTarget(TrackedTarget):
+    def __init__(self, position: Position[WorldFrame], instance_id: int):
+        super().__init__(JetsonTimestamp(0), instance_id)
+        self._position = position
+
+    @property
+    def latest_estimated_position(self) -> Position[WorldFrame]:
+        return self._position
+
+    def extrapolate_position(self, timestamp: JetsonTimestamp) -> Position[WorldFrame]:
+        return self._position
+
+    def update_from_new_position_measurement(
+        self, measurement: MeasuredPosition[WorldFrame], timestamp: JetsonTimestamp
+    ):
+        raise NotImplementedError
+
+    def update_from_extrapolation(self, timestamp: JetsonTimestamp):
+        raise NotImplementedError
+
+
+class _TurretTransformProvider:
+    def __init__(self, transform: Transform[WorldFrame, LauncherFrame]):
+        self.world_frame_to_launcher_frame_transform = transform
+
+
+# Away from the world origin and turned, so that the rules have to apply it
+_TURRET_ORIGIN = Position[WorldFrame](1.0, -2.0, 0.5)
+_PROVIDER = _TurretTransformProvider(
+    Transform(_TURRET_ORIGIN, Orientation.from_axis_and_angle(0.7, (0.0, 0.0, 1.0)))
+)
+
+
+def _launcher_position(target: TrackedTarget) -> Position[LauncherFrame]:
+    transform = _PROVIDER.world_frame_to_launcher_frame_transform
+    return transform.apply_to_position(target.latest_estimated_position)
+
+
+def _reference_rotation_score(target: TrackedTarget) -> Optional[float]:
+    position = _launcher_position(target)
+    distance = math.sqrt(position.x**2 + position.y**2 + position.z**2)
+    if distance == 0:
+        return 0
+    return math.acos(max(-1.0, min(1.0, position.x / distance))) * 100 / math.pi
+
+
+def _reference_distance_score(target: TrackedTarget) -> Optional[float]:
+    position = _launcher_position(target)
+    distance = math.sqrt(position.x**2 + position.y**2 + position.z**2)
+    if distance > _MAX_DISTANCE:
+        return None
+    return distance / _MAX_DISTANCE * 100
+
+
+_REFERENCE_SCORES = {
+    TurretRotationDifferenceRule: _reference_rotation_score,
+    TurretDistanceRule: _reference_distance_score,
+}
+
+
+def _rules() -> List[Tuple[TargetSelectionRule, float]]:
+    return [
+        (TurretRotationDifferenceRule(_PROVIDER), 1.0),
+        (TurretDistanceRule(_MAX_DISTANCE, _PROVIDER), 0.5),
+    ]
+
+
+def _reference_select(
+    config: TargetSelectorConfiguration,
+    rules: Sequence[Tuple[TargetSelectionRule, float]],
+    targets: Sequence[TrackedTarget],
+) -> Optional[TrackedTarget]:
+    # The per-target _evaluate_target loop and min that select_target replaced
+    valid_targets = []
+    for target in targets:
+        weighted_score: Optional[float] = 0
+        for rule, weight in rules:
+            rule_score = _REFERENCE_SCORES[type(rule)](target)
+            if rule_score is None:
+                weighted_score = None
+                break
+            weighted_score += weight * rule_score
+        if weighted_score is None:
+            continue
+        if (
+            config.maximum_score_threshold is None
+            or weighted_score < config.maximum_score_threshold
+        ):
+            valid_targets.append((target, weighted_score))
+
+    if len(valid_targets) == 0:
+        return None
+
+    min_target, _ = min(valid_targets, key=lambda target_score: target_score[1])
+    return min_target
+
+
+def _random_targets(seed: int, count: int) -> List[_StaticTarget]:
+    rng = random.Random(seed)
+    return [
+        _StaticTarget(
+            Position[WorldFrame](
+                rng.uniform(-10.0, 10.0), rng.uniform(-10.0, 10.0), rng.uniform(-1.0, 2.0)
+            ),
+            instance_id,
+        )
+        for instance_id in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("threshold", [None, 40.0, 80.0])
+def test_select_target_matches_reference(seed: int, threshold: Optional[float]):
+    config = TargetSelectorConfiguration(maximum_score_threshold=threshold, max_radius=1.0)
+    targets = _random_targets(seed, 10)
+
+    assert select_target(config, _rules(), targets) is _reference_select(
+        config, _rules(), targets
+    )
+
+
+def test_select_target_breaks_ties_by_first_target():
+    config = TargetSelectorConfiguration(maximum_score_threshold=None, max_radius=1.0)
+    position = Position[WorldFrame](3.0, 1.0, 0.0)
+    targets = [_StaticTarget(position, 0), _StaticTarget(position, 1)]
+
+    assert select_target(config, _rules(), targets) is targets[0]
+    assert _reference_select(config, _rules(), targets) is targets[0]
+
+
+def test_select_target_excludes_scores_at_threshold():
+    target = _StaticTarget(Position[WorldFrame](3.0, 1.0, 0.0), 0)
+    score = 1.0 * _reference_rotation_score(target) + 0.5 * _reference_distance_score(target)
+
+    at_threshold = TargetSelectorConfiguration(maximum_score_threshold=score, max_radius=1.0)
+    above_threshold = TargetSelectorConfiguration(
+        maximum_score_threshold=score + 1e-6, max_radius=1.0
+    )
+
+    assert select_target(at_threshold, _rules(), [target]) is None
+    assert select_target(above_threshold, _rules(), [target]) is target
+
+
+def test_select_target_returns_none_when_all_targets_are_invalid():
+    config = TargetSelectorConfiguration(maximum_score_threshold=None, max_radius=1.0)
+    far = _TURRET_ORIGIN.x + 2 * _MAX_DISTANCE
+    targets = [
+        _StaticTarget(Position[WorldFrame](far, 0.0, 0.0), 0),
+        _StaticTarget(Position[WorldFrame](0.0, -far, 0.0), 1),
+    ]
+
+    assert _reference_select(config, _rules(), targets) is None
+    assert select_target(config, _rules(), targets) is None
+
+
+def test_select_target_prefers_target_at_turret_origin():
+    config = TargetSelectorConfiguration(maximum_score_threshold=None, max_radius=1.0)
+    targets = _random_targets(0, 5) + [_StaticTarget(_TURRET_ORIGIN, 5)]
+
+    assert _reference_select(config, _rules(), targets) is targets[-1]
+    assert select_target(config, _rules(), targets) is targets[-1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rule_scores_match_reference(seed: int):
+    targets = _random_targets(seed, 10) + [_StaticTarget(_TURRET_ORIGIN, 10)]
+
+    for rule, _ in _rules():
+        scores = rule.get_scores(targets)
+        for target, score in zip(targets, scores):
+            expected = _REFERENCE_SCORES[type(rule)](target)
+            if expected is None:
+                assert math.isnan(score)
+                assert rule.get_score(target) is None
+            else:
+                assert score == pytest.approx(expected, abs=1e-9)
+                assert rule.get_score(target) == score
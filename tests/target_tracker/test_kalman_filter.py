@@ -0,0 +1,91 @@
+"""KalmanFilter results against the former textbook covariance update."""
+import numpy as np
+import pytest
+
+from project_otto.target_tracker.estimators import (
+    Estimation,
+    KalmanFilter,
+    nearest_valid_covariance,
+)
+
+# Position and velocity along three axes, of which the positions are measured
+_STATE_SHAPE = (2, 3)
+_MEASUREMENT_SHAPE = (3,)
+_MEASUREMENT_MAP = np.eye(3, 6).reshape(_MEASUREMENT_SHAPE + _STATE_SHAPE)
+
+_PRIOR_COVARIANCE = np.array(
+    [
+        [0.50, 0.05, 0.02, 0.10, 0.00, 0.01],
+        [0.05, 0.40, 0.03, 0.00, 0.08, 0.00],
+        [0.02, 0.03, 0.60, 0.01, 0.00, 0.12],
+        [0.10, 0.00, 0.01, 1.00, 0.02, 0.00],
+        [0.00, 0.08, 0.00, 0.02, 0.90, 0.03],
+        [0.01, 0.00, 0.12, 0.00, 0.03, 1.10],
+    ]
+)
+_PRIOR = Estimation(
+    np.array([[1.0, 2.0, 3.0], [0.5, -0.5, 0.25]]), _PRIOR_COVARIANCE.reshape(2 * _STATE_SHAPE)
+)
+_MEASUREMENT = np.array([1.2, 1.9, 3.3])
+_MEASUREMENT_COVARIANCE = np.array(
+    [
+        [0.20, 0.01, 0.00],
+        [0.01, 0.30, 0.02],
+        [0.00, 0.02, 0.25],
+    ]
+)
+
+
+def _reference_filter(prediction: Estimation) -> Estimation:
+    # The filter step before the Joseph form: s - khs, corrected by nearest_valid_covariance
+    h = _MEASUREMENT_MAP.reshape(3, 6)
+    x = prediction.expectation.reshape(6)
+    s = prediction.covariance.reshape(6, 6)
+
+    y = _MEASUREMENT - h @ x
+    d = h @ s @ h.T + _MEASUREMENT_COVARIANCE
+    k = s @ h.T @ np.linalg.inv(d)
+
+    return Estimation(
+        (x + k @ y).reshape(_STATE_SHAPE),
+        nearest_valid_covariance(s - k @ h @ s).reshape(2 * _STATE_SHAPE),
+    )
+
+
+@pytest.mark.parametrize("robust_covariance", [False, True])
+def test_kalman_filter_matches_reference(robust_covariance: bool):
+    kalman_filter = KalmanFilter(
+        _STATE_SHAPE, _MEASUREMENT_SHAPE, _MEASUREMENT_MAP, robust_covariance
+    )
+
+    result = kalman_filter.filter(_PRIOR, _MEASUREMENT, _MEASUREMENT_COVARIANCE)
+    expected = _reference_filter(_PRIOR)
+
+    np.testing.assert_allclose(result.expectation, expected.expectation, rtol=1e-12)
+    np.testing.assert_allclose(result.covariance, expected.covariance, rtol=1e-9, atol=1e-12)
+
+
+def test_kalman_filter_covariance_is_symmetric():
+    kalman_filter = KalmanFilter(_STATE_SHAPE, _MEASUREMENT_SHAPE, _MEASUREMENT_MAP)
+
+    covariance = kalman_filter.filter(
+        _PRIOR, _MEASUREMENT, _MEASUREMENT_COVARIANCE
+    ).covariance.reshape(6, 6)
+
+    np.testing.assert_array_equal(covariance, covariance.T)
+    assert np.all(np.linalg.eigvalsh(covariance) >= 0)
+
+
+def test_kalman_filter_update_matches_predict_then_filter():
+    kalman_filter = KalmanFilter(_STATE_SHAPE, _MEASUREMENT_SHAPE, _MEASUREMENT_MAP)
+    # Constant velocity over 0.1s, i.e. position += 0.1 * velocity
+    evol_map = np.eye(6).reshape(2 * _STATE_SHAPE) + 0.1 * np.eye(6, k=3).reshape(2 * _STATE_SHAPE)
+    evol_noise = 0.01 * np.eye(6).reshape(2 * _STATE_SHAPE)
+
+    result = kalman_filter.update(
+        _PRIOR, evol_map, evol_noise, _MEASUREMENT, _MEASUREMENT_COVARIANCE
+    )
+    expected = _reference_filter(kalman_filter.predict(_PRIOR, evol_map, evol_noise))
+
+    np.testing.assert_allclose(result.expectation, expected.expectation, rtol=1e-12)
+    np.testing.assert_allclose(result.covariance, expected.covariance, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,169 @@
+"""Measurement association in TargetTracker, against the former per-target nearest search."""
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytest
+
+from project_otto.frames import WorldFrame
+from project_otto.robomaster import TeamColor
+from project_otto.spatial import LinearUncertainty, MeasuredPosition, Position
+from project_otto.target_detector import DetectedTargetPosition, WorldDetectedTargetSet
+from project_otto.target_tracker import (
+    TargetConfiguration,
+    TargetTracker,
+    TrackedTarget,
+    TrackerConfiguration,
+)
+from project_otto.time import Duration
+from project_otto.timestamps import JetsonTimestamp, OdometryTimestamp
+
+Point = Tuple[float, float, float]
+
+_TARGET_CONFIG = TargetConfiguration(
+    num_independent_vars=3,
+    num_derivatives=0,
+    num_measured_vars=3,
+    initial_derivative_variance=[],
+    ode_coefficients=np.zeros((3, 0, 3)),
+    intrinsic_noise=np.zeros((1, 3)),
+    measurement_map=np.eye(3).reshape((3, 1, 3)),
+)
+
+
+class _StationaryTarget(TrackedTarget):
+    """Target that stays at its most recent measurement, recording what it was updated with."""
+
+    def __init__(
+        self,
+        config: TargetConfiguration,
+        measurement: MeasuredPosition[WorldFrame],
+        timestamp: JetsonTimestamp,
+        instance_id: int,
+    ):
+        super().__init__(timestamp, instance_id)
+        self._position = measurement.position
+        self.matched: Optional[Position[WorldFrame]] = None
+
+    def extrapolate_position(self, timestamp: JetsonTimestamp) -> Position[WorldFrame]:
+        return self._position
+
+    def update_from_new_position_measurement(
+        self, measurement: MeasuredPosition[WorldFrame], timestamp: JetsonTimestamp
+    ):
+        super().update_from_new_position_measurement(measurement, timestamp)
+        self.matched = measurement.position
+
+    def update_from_extrapolation(self, timestamp: JetsonTimestamp):
+        self.matched = None
+
+
+def _measured_set(points: Sequence[Point], time_microsecs: int) -> WorldDetectedTargetSet:
+    uncertainty: LinearUncertainty[WorldFrame] = LinearUncertainty.from_variances(1, 1, 1)
+    return WorldDetectedTargetSet(
+        tuple(
+            DetectedTargetPosition(1.0, TeamColor.RED, MeasuredPosition(Position(*p), uncertainty))
+            for p in points
+        ),
+        JetsonTimestamp(time_microsecs),
+        OdometryTimestamp(0),
+    )
+
+
+def _tracker(targets: Sequence[Point], max_distance: float) -> TargetTracker[_StationaryTarget]:
+    tracker = TargetTracker(
+        TrackerConfiguration(max_distance, Duration.from_seconds(10)),
+        _TARGET_CONFIG,
+        _StationaryTarget,
+    )
+    tracker.update(_measured_set(targets, 0))
+    return tracker
+
+
+def _reference_matches(
+    targets: Sequence[Point], measurements: Sequence[Point], max_distance: float
+) -> Dict[int, Optional[Point]]:
+    # The per-target search TargetTracker.update replaced
+    remaining = list(measurements)
+    matches: Dict[int, Optional[Point]] = {}
+    for index, target in enumerate(targets):
+        nearest: Optional[Point] = None
+        nearest_distance = max_distance
+        for measurement in remaining:
+            distance = math.dist(target, measurement)
+            if distance < nearest_distance:
+                nearest = measurement
+                nearest_distance = distance
+        if nearest is not None:
+            remaining.remove(nearest)
+        matches[index] = nearest
+    return matches
+
+
+def _matches(tracker: TargetTracker[_StationaryTarget], count: int) -> Dict[int, Optional[Point]]:
+    # Matches of the first count targets, keyed by their index in creation order
+    return {
+        target.instance_id - 1: None if target.matched is None else target.matched.as_tuple()
+        for target in tracker.all_tracked_targets
+        if target.instance_id <= count
+    }
+
+
+def test_target_tracker_max_distance_is_exclusive():
+    tracker = _tracker([(0.0, 0.0, 0.0)], max_distance=1.0)
+
+    tracker.update(_measured_set([(1.0, 0.0, 0.0)], 1))
+
+    targets = tracker.all_tracked_targets
+    assert [target.instance_id for target in targets] == [1, 2]
+    assert targets[0].matched is None
+
+
+def test_target_tracker_associates_within_max_distance():
+    tracker = _tracker([(0.0, 0.0, 0.0)], max_distance=1.0)
+
+    tracker.update(_measured_set([(0.0, 0.999, 0.0), (0.0, 0.0, 0.5)], 1))
+
+    targets = tracker.all_tracked_targets
+    assert [target.instance_id for target in targets] == [1, 2]
+    assert targets[0].matched == Position(0.0, 0.0, 0.5)
+    assert targets[1].extrapolate_position(JetsonTimestamp(1)) == Position(0.0, 0.999, 0.0)
+
+
+def test_target_tracker_earlier_target_takes_shared_measurement():
+    tracker = _tracker([(0.0, 0.0, 0.0), (0.0, 0.0, 0.25)], max_distance=1.0)
+
+    tracker.update(_measured_set([(0.0, 0.0, 0.5)], 1))
+
+    first, second = tracker.all_tracked_targets
+    assert first.matched == Position(0.0, 0.0, 0.5)
+    assert second.matched is None
+
+
+def test_target_tracker_without_measurements():
+    tracker = _tracker([(0.0, 0.0, 0.0), (1.0, 1.0, 1.0)], max_distance=1.0)
+
+    tracker.update(_measured_set([], 1))
+
+    assert [target.matched for target in tracker.all_tracked_targets] == [None, None]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_target_tracker_matches_reference(seed: int):
+    rng = random.Random(seed)
+    targets: List[Point] = [
+        (rng.uniform(0, 3), rng.uniform(0, 3), rng.uniform(0, 3)) for _ in range(8)
+    ]
+    measurements: List[Point] = [
+        (rng.uniform(0, 3), rng.uniform(0, 3), rng.uniform(0, 3)) for _ in range(8)
+    ]
+    tracker = _tracker(targets, max_distance=1.0)
+
+    tracker.update(_measured_set(measurements, 1))
+
+    expected = _reference_matches(targets, measurements, max_distance=1.0)
+    assert _matches(tracker, len(targets)) == expected
+    assert len(tracker.all_tracked_targets) == len(targets) + sum(
+        measurement not in expected.values() for measurement in measurements
+    )
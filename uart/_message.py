@@ -9,6 +9,8 @@ class Message(ABC):
     data.
     """
 
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def get_type_id() -> int:
@@ -25,6 +27,8 @@ class SerializableMessage(Message):
     Subclasses are to override serialize method with encoding scheme.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def serialize(self) -> bytes:
         """
@@ -43,6 +47,8 @@ class ReadableMessage(Message):
     Subclasses are to override parse method with decoding scheme.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def parse(cls, data: bytes) -> "ReadableMessage":
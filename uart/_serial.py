@@ -66,11 +66,16 @@ class Serial(AbstractSerial):
     """
     Simple type-explicit wrapper for serial.Serial library object.
 
+    Reads are buffered: whenever more data is needed, everything already waiting in the driver is
+    drained in a single read, and subsequent small reads are served from memory. This avoids one
+    system call per byte while scanning for headers.
+
     Raises:
         SerialPortOpenException: if the port was not opened successfully
     """
 
     def __init__(self, port_name: str, baud_rate: int):
+        self._read_buffer = bytearray()
 
         try:
             self.port = serial.Serial(
@@ -98,14 +103,20 @@ class Serial(AbstractSerial):
         """
         Returns number of bytes in receiving buffer.
         """
-        in_waiting: int = self.port.in_waiting
+        in_waiting: int = len(self._read_buffer) + self.port.in_waiting
         return in_waiting
 
     def read(self, size: int = 1) -> bytes:
         """
-        Returns size bytes from buffer.
+        Returns size bytes from buffer, blocking until that many bytes are available.
         """
-        data: bytes = self.port.read(size)
+        while len(self._read_buffer) < size:
+            missing = size - len(self._read_buffer)
+            chunk: bytes = self.port.read(max(missing, self.port.in_waiting))
+            self._read_buffer += chunk
+
+        data = bytes(self._read_buffer[:size])
+        del self._read_buffer[:size]
         return data
 
     def write(self, data: bytes):
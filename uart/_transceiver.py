@@ -2,7 +2,7 @@ import logging
 import struct
 import warnings
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Sequence, Tuple, TypeVar
 
 from project_otto.timestamps import Timestamp
 
@@ -94,6 +94,15 @@ class Transceiver(Generic[TimestampType], HostMessageReceiver, HostMessageTransm
             else:
                 self._handler_dict[handler.type_id] = handler
 
+        # Bound parse/handle methods per message type, resolved once so that dispatching a
+        # received frame is a single dict lookup
+        self._dispatch_dict: Dict[
+            int, Tuple[Callable[[bytes], Any], Callable[[Any, TimestampType], None]]
+        ] = {
+            type_id: (handler.msg_class.parse, handler.handle)
+            for type_id, handler in self._handler_dict.items()
+        }
+
         self.serial = serial
         self._get_current_time = get_current_time
 
@@ -220,15 +229,16 @@ class Transceiver(Generic[TimestampType], HostMessageReceiver, HostMessageTransm
                 if max_packets is not None and self.serial.in_waiting < body_size:
                     break
 
-                msg_type_raw = self.serial.read(MSG_TYPE_SIZE)
-                msg_data = self.serial.read(self._msg_len)
-                received_crc16_raw = self.serial.read(FOOTER_SIZE)
+                # Single read for the whole body so the receiver thread only wakes once per frame
+                body_bytes = self.serial.read(body_size)
+                data_end = MSG_TYPE_SIZE + self._msg_len
+                msg_data = body_bytes[MSG_TYPE_SIZE:data_end]
 
-                msg_type = struct.unpack("<H", msg_type_raw)[0]
-                received_crc16 = struct.unpack("<H", received_crc16_raw)[0]
+                msg_type = struct.unpack_from("<H", body_bytes)[0]
+                received_crc16 = struct.unpack_from("<H", body_bytes, data_end)[0]
 
                 # Validate footer checksum; if fail, reject and drop frame
-                self._msg_running_crc16 = crc16(msg_type_raw + msg_data, self._msg_running_crc16)
+                self._msg_running_crc16 = crc16(body_bytes[:data_end], self._msg_running_crc16)
                 if self._msg_running_crc16 != received_crc16:
                     logging.warning(
                         "Incoming UART body failed CRC check!"
@@ -240,16 +250,18 @@ class Transceiver(Generic[TimestampType], HostMessageReceiver, HostMessageTransm
                     continue
 
                 # Execute appropriate handler
-                handler = self._handler_dict.get(msg_type)
-                if handler is None:
+                dispatch = self._dispatch_dict.get(msg_type)
+                if dispatch is None:
                     warnings.warn(
                         f"No handler for message of type {msg_type}, data {msg_data}.",
                         RuntimeWarning,
                     )
                 else:
+                    parse, handle = dispatch
+
                     # Attempt to parse the message
                     try:
-                        handler.msg_class.parse(msg_data)
+                        msg = parse(msg_data)
                     # If failed, reset the state of the parser and raise a message parse error
                     # exception
                     except Exception as e:
@@ -257,9 +269,7 @@ class Transceiver(Generic[TimestampType], HostMessageReceiver, HostMessageTransm
                         num_processed_packets += 1
                         raise MessageParseUnhandledError("Unable to parse message.") from e
 
-                    handler.handle(
-                        handler.msg_class.parse(msg_data), self.last_header_receipt_timestamp
-                    )
+                    handle(msg, self.last_header_receipt_timestamp)
 
                 self.reset_states()
                 num_processed_packets += 1